@@ -4,17 +4,14 @@ import hashlib
 from pathlib import Path
 
 
-def sha256_bytes(value: bytes) -> str:
+def sha256_bytes(value: bytes | bytearray | memoryview) -> str:
     return hashlib.sha256(value).hexdigest()
 
 
 def sha256_text(value: str) -> str:
-    return sha256_bytes(value.encode("utf-8"))
+    return hashlib.sha256(value.encode("utf-8")).hexdigest()
 
 
 def file_sha256(path: Path) -> str:
-    hasher = hashlib.sha256()
     with path.open("rb") as handle:
-        for chunk in iter(lambda: handle.read(1024 * 1024), b""):
-            hasher.update(chunk)
-    return hasher.hexdigest()
+        return hashlib.file_digest(handle, "sha256").hexdigest()
@@ -7,6 +7,11 @@ from typing import Any
 from django.conf import settings
 from openai import OpenAI
 
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
 
 _client: OpenAI | None = None
 
@@ -28,11 +33,18 @@ class ChatJsonResult:
 
 def _strip_fence(text: str) -> str:
     cleaned = text.strip()
-    if cleaned.startswith("```"):
-        cleaned = cleaned.split("\n", 1)[-1]
-        if cleaned.endswith("```"):
-            cleaned = cleaned[: -3]
-    return cleaned.strip()
+    if not cleaned.startswith("```"):
+        return cleaned
+    newline = cleaned.find("\n")
+    if newline != -1:
+        cleaned = cleaned[newline + 1 :]
+    return cleaned.removesuffix("```").strip()
+
+
+def _loads_json(text: str) -> Any:
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
 
 
 def chat_json(
@@ -59,7 +71,7 @@ def chat_json(
         )
         message = response.choices[0].message.content or "{}"
         try:
-            parsed = json.loads(_strip_fence(message))
+            parsed = _loads_json(_strip_fence(message))
             if not isinstance(parsed, dict):
                 raise ValueError("JSON root must be an object")
             return ChatJsonResult(payload=parsed, model=response.model)
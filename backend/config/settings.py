@@ -20,6 +20,13 @@ def env_bool(name: str, default: bool = False) -> bool:
     return value.strip().lower() in {"1", "true", "yes", "on"}
 
 
+def database_options() -> dict[str, object]:
+    # Opt-in only: server-side binding does not work behind transaction-pooling proxies such as pgbouncer.
+    if not env_bool("DATABASE_SERVER_SIDE_BINDING", False):
+        return {}
+    return {"server_side_binding": True}
+
+
 def parse_database_url(database_url: str) -> dict[str, object]:
     parsed = urlparse(database_url)
     if parsed.scheme not in {"postgres", "postgresql"}:
@@ -33,6 +40,7 @@ def parse_database_url(database_url: str) -> dict[str, object]:
         "HOST": parsed.hostname or "localhost",
         "PORT": str(parsed.port or 5432),
         "CONN_MAX_AGE": 60,
+        "OPTIONS": database_options(),
     }
 
 
@@ -50,6 +58,7 @@ def default_local_database() -> dict[str, object]:
         "HOST": env("DATABASE_HOST", "localhost"),
         "PORT": env("DATABASE_PORT", "5432"),
         "CONN_MAX_AGE": 60,
+        "OPTIONS": database_options(),
     }
 
 
@@ -169,6 +178,8 @@ COMPOSE_MAX_REFERENCE_CHUNKS = int(env("COMPOSE_MAX_REFERENCE_CHUNKS", "6"))
 COMPOSE_MAX_REFERENCE_TOKENS = int(env("COMPOSE_MAX_REFERENCE_TOKENS", "1800"))
 OFFICE_ALLOW_SVG_RASTERIZE = env_bool("OFFICE_ALLOW_SVG_RASTERIZE", False)
 OFFICE_MAX_CONCURRENT_GENERATIONS = int(env("OFFICE_MAX_CONCURRENT_GENERATIONS", "2"))
+HANDBOOK_WORKER_PROCESSES = int(env("HANDBOOK_WORKER_PROCESSES", "4"))
+HANDBOOK_PARALLEL_MIN_FILES = int(env("HANDBOOK_PARALLEL_MIN_FILES", "16"))
 
 DATA_ROOT = Path(env("DATA_ROOT", str(PROJECT_ROOT / "data"))).resolve()
 DOCUMENTS_DATA_ROOT = DATA_ROOT / "documents"
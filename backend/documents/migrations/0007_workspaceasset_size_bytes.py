@@ -0,0 +1,30 @@
+from pathlib import Path
+
+from django.db import migrations, models
+
+
+def backfill_workspace_asset_sizes(apps, schema_editor):
+    WorkspaceAsset = apps.get_model("documents", "WorkspaceAsset")
+    updated = []
+    for asset in WorkspaceAsset.objects.filter(size_bytes__isnull=True).only("id", "file_path").iterator():
+        try:
+            asset.size_bytes = Path(asset.file_path).stat().st_size
+        except OSError:
+            continue
+        updated.append(asset)
+    WorkspaceAsset.objects.bulk_update(updated, ["size_bytes"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("documents", "0006_alter_placeholdervalue_source_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="workspaceasset",
+            name="size_bytes",
+            field=models.BigIntegerField(blank=True, null=True),
+        ),
+        migrations.RunPython(backfill_workspace_asset_sizes, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("documents", "0007_workspaceasset_size_bytes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="placeholder",
+            index=models.Index(
+                fields=["handbook_file", "required"],
+                include=["key", "kind"],
+                name="docs_p_file_required_cover",
+            ),
+        ),
+    ]
@@ -0,0 +1,30 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("documents", "0008_placeholder_file_required_index"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="workspaceasset",
+            name="documents_w_handboo_7944f3_idx",
+        ),
+        migrations.AddIndex(
+            model_name="document",
+            index=models.Index(
+                condition=models.Q(deleted_at__isnull=True),
+                fields=["handbook_id", "relative_path"],
+                name="docs_d_live_path_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="workspaceasset",
+            index=models.Index(
+                condition=models.Q(deleted_at__isnull=True),
+                fields=["handbook_id", "asset_type", "-updated_at"],
+                name="docs_wa_live_type_idx",
+            ),
+        ),
+    ]
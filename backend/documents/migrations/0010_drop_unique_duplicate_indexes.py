@@ -0,0 +1,18 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("documents", "0009_live_row_partial_indexes"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="handbookfile",
+            name="docs_hf_hb_path_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="referencechunk",
+            name="docs_rc_doc_ordinal_idx",
+        ),
+    ]
@@ -0,0 +1,19 @@
+from django.contrib.postgres.indexes import HashIndex
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("documents", "0010_drop_unique_duplicate_indexes"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="referencechunk",
+            name="docs_rc_content_hash_idx",
+        ),
+        migrations.AddIndex(
+            model_name="referencechunk",
+            index=HashIndex(fields=["content_hash"], name="docs_rc_content_hash_hash"),
+        ),
+    ]
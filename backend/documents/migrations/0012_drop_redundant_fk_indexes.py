@@ -0,0 +1,51 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("documents", "0011_reference_chunk_content_hash_hash_index"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="placeholdergenerationaudit",
+            name="handbook",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="generation_audits",
+                to="documents.handbook",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="placeholdergenerationaudit",
+            name="handbook_file",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="generation_audits",
+                to="documents.handbookfile",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="placeholdergenerationaudit",
+            name="placeholder",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="generation_audits",
+                to="documents.placeholder",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="referencechunk",
+            name="reference_document",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="chunks",
+                to="documents.referencedocument",
+            ),
+        ),
+    ]
@@ -0,0 +1,33 @@
+from django.db import migrations, models
+
+
+def drop_unversioned_entries(apps, schema_editor):
+    # Entries written before versioning may come from an older extractor; they are re-extracted on demand.
+    DocumentTextExtractionCache = apps.get_model("documents", "DocumentTextExtractionCache")
+    DocumentTextExtractionCache.objects.filter(extractor_version="").delete()
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("documents", "0012_drop_redundant_fk_indexes"),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name="documenttextextractioncache",
+            name="docs_text_extract_cache_unique_checksum_type",
+        ),
+        migrations.AddField(
+            model_name="documenttextextractioncache",
+            name="extractor_version",
+            field=models.CharField(default="", max_length=32),
+        ),
+        migrations.RunPython(drop_unversioned_entries, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="documenttextextractioncache",
+            constraint=models.UniqueConstraint(
+                fields=["checksum", "file_type", "extractor_version"],
+                name="docs_text_extract_cache_unique_version",
+            ),
+        ),
+    ]
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import uuid
 
+from django.contrib.postgres.indexes import HashIndex
 from django.db import models
 
 
@@ -22,6 +23,11 @@ class Document(models.Model):
         indexes = [
             models.Index(fields=["handbook_id", "deleted_at"], name="documents_d_handboo_56b9ce_idx"),
             models.Index(fields=["handbook_id", "updated_at"], name="documents_d_handboo_9a469e_idx"),
+            models.Index(
+                fields=["handbook_id", "relative_path"],
+                condition=models.Q(deleted_at__isnull=True),
+                name="docs_d_live_path_idx",
+            ),
         ]
 
 
@@ -102,6 +108,7 @@ class WorkspaceAsset(models.Model):
     file_path = models.TextField()
     mime_type = models.CharField(max_length=255)
     sha256 = models.CharField(max_length=64, blank=True, default="")
+    size_bytes = models.BigIntegerField(null=True, blank=True)
     width = models.IntegerField(null=True, blank=True)
     height = models.IntegerField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
@@ -111,7 +118,11 @@ class WorkspaceAsset(models.Model):
     class Meta:
         db_table = "documents_workspace_asset"
         indexes = [
-            models.Index(fields=["handbook_id", "asset_type", "deleted_at"], name="documents_w_handboo_7944f3_idx"),
+            models.Index(
+                fields=["handbook_id", "asset_type", "-updated_at"],
+                condition=models.Q(deleted_at__isnull=True),
+                name="docs_wa_live_type_idx",
+            ),
         ]
 
 
@@ -218,7 +229,6 @@ class HandbookFile(models.Model):
         ]
         indexes = [
             models.Index(fields=["handbook", "parse_status"], name="docs_hf_hb_parse_idx"),
-            models.Index(fields=["handbook", "path_in_handbook"], name="docs_hf_hb_path_idx"),
         ]
 
 
@@ -250,6 +260,11 @@ class Placeholder(models.Model):
         ]
         indexes = [
             models.Index(fields=["handbook_file", "kind"], name="docs_p_file_kind_idx"),
+            models.Index(
+                fields=["handbook_file", "required"],
+                include=["key", "kind"],
+                name="docs_p_file_required_cover",
+            ),
         ]
 
 
@@ -430,6 +445,7 @@ class ReferenceChunk(models.Model):
         ReferenceDocument,
         on_delete=models.CASCADE,
         related_name="chunks",
+        db_index=False,
     )
     ordinal = models.IntegerField()
     chunk_type = models.CharField(max_length=32)
@@ -449,8 +465,7 @@ class ReferenceChunk(models.Model):
             )
         ]
         indexes = [
-            models.Index(fields=["reference_document", "ordinal"], name="docs_rc_doc_ordinal_idx"),
-            models.Index(fields=["content_hash"], name="docs_rc_content_hash_idx"),
+            HashIndex(fields=["content_hash"], name="docs_rc_content_hash_hash"),
         ]
 
 
@@ -464,16 +479,19 @@ class PlaceholderGenerationAudit(models.Model):
         Handbook,
         on_delete=models.CASCADE,
         related_name="generation_audits",
+        db_index=False,
     )
     handbook_file = models.ForeignKey(
         HandbookFile,
         on_delete=models.CASCADE,
         related_name="generation_audits",
+        db_index=False,
     )
     placeholder = models.ForeignKey(
         Placeholder,
         on_delete=models.CASCADE,
         related_name="generation_audits",
+        db_index=False,
     )
     mode = models.CharField(max_length=16, choices=Mode.choices)
     instruction = models.TextField(blank=True, default="")
@@ -503,6 +521,7 @@ class PlaceholderGenerationAudit(models.Model):
 class DocumentTextExtractionCache(models.Model):
     checksum = models.CharField(max_length=64)
     file_type = models.CharField(max_length=8, choices=ReferenceDocument.FileType.choices)
+    extractor_version = models.CharField(max_length=32, default="")
     normalized_data = models.JSONField(default=dict)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -511,8 +530,8 @@ class DocumentTextExtractionCache(models.Model):
         db_table = "documents_text_extraction_cache"
         constraints = [
             models.UniqueConstraint(
-                fields=["checksum", "file_type"],
-                name="docs_text_extract_cache_unique_checksum_type",
+                fields=["checksum", "file_type", "extractor_version"],
+                name="docs_text_extract_cache_unique_version",
             )
         ]
         indexes = [
@@ -41,6 +41,7 @@ class DocumentVariableSerializer(serializers.ModelSerializer):
             "metadata",
             "created_at",
         ]
+        read_only_fields = fields
 
 
 class DocumentVersionSerializer(serializers.ModelSerializer):
@@ -58,6 +59,7 @@ class DocumentVersionSerializer(serializers.ModelSerializer):
             "metadata",
             "created_at",
         ]
+        read_only_fields = fields
 
 
 class DocumentSerializer(serializers.ModelSerializer):
@@ -80,6 +82,7 @@ class DocumentSerializer(serializers.ModelSerializer):
             "variables",
             "versions",
         ]
+        read_only_fields = fields
 
 
 class WorkspaceAssetSerializer(serializers.ModelSerializer):
@@ -107,6 +110,7 @@ class WorkspaceAssetSerializer(serializers.ModelSerializer):
             "created_at",
             "updated_at",
         ]
+        read_only_fields = fields
 
     def get_kind(self, obj: WorkspaceAsset) -> str:
         return obj.asset_type
@@ -143,6 +147,7 @@ class HandbookSerializer(serializers.ModelSerializer):
             "created_at",
             "updated_at",
         ]
+        read_only_fields = fields
 
 
 class HandbookFileSerializer(serializers.ModelSerializer):
@@ -165,6 +170,7 @@ class HandbookFileSerializer(serializers.ModelSerializer):
             "created_at",
             "updated_at",
         ]
+        read_only_fields = fields
 
 
 class PlaceholderSerializer(serializers.ModelSerializer):
@@ -180,6 +186,7 @@ class PlaceholderSerializer(serializers.ModelSerializer):
             "meta",
             "created_at",
         ]
+        read_only_fields = fields
 
 
 class PlaceholderValueSerializer(serializers.ModelSerializer):
@@ -195,6 +202,7 @@ class PlaceholderValueSerializer(serializers.ModelSerializer):
             "source",
             "updated_at",
         ]
+        read_only_fields = fields
 
 
 class ReferenceDocumentLinkSerializer(serializers.ModelSerializer):
@@ -208,6 +216,7 @@ class ReferenceDocumentLinkSerializer(serializers.ModelSerializer):
             "placeholder_id",
             "created_at",
         ]
+        read_only_fields = fields
 
 
 class ReferenceChunkSerializer(serializers.ModelSerializer):
@@ -225,6 +234,7 @@ class ReferenceChunkSerializer(serializers.ModelSerializer):
             "estimated_tokens",
             "created_at",
         ]
+        read_only_fields = fields
 
 
 class ReferenceDocumentSerializer(serializers.ModelSerializer):
@@ -250,6 +260,7 @@ class ReferenceDocumentSerializer(serializers.ModelSerializer):
             "updated_at",
             "links",
         ]
+        read_only_fields = fields
 
     def get_links(self, obj: ReferenceDocument) -> list[dict[str, object]]:
         links = getattr(obj, "links", None)
@@ -285,6 +296,7 @@ class PlaceholderGenerationAuditSerializer(serializers.ModelSerializer):
             "error_message",
             "created_at",
         ]
+        read_only_fields = fields
 
     def get_usage(self, obj: PlaceholderGenerationAudit) -> dict[str, int]:
         return {
@@ -309,8 +321,19 @@ class VersionSnapshotSerializer(serializers.ModelSerializer):
             "download_url",
             "created_at",
         ]
+        read_only_fields = fields
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._downloadable: dict[object, bool] = {}
 
     def get_downloadable(self, obj: VersionSnapshot) -> bool:
+        # download_url needs the same answer; check the filesystem once per snapshot.
+        if obj.pk not in self._downloadable:
+            self._downloadable[obj.pk] = self._is_downloadable(obj)
+        return self._downloadable[obj.pk]
+
+    def _is_downloadable(self, obj: VersionSnapshot) -> bool:
         manifest = obj.manifest if isinstance(obj.manifest, dict) else {}
         if manifest.get("reason") != "export":
             return False
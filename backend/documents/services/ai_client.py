@@ -5,7 +5,8 @@ import time
 from dataclasses import dataclass
 
 from django.conf import settings
-from openai import OpenAI
+
+from common.openai_client import get_openai_client
 
 
 @dataclass(frozen=True)
@@ -30,7 +31,7 @@ class AiClient:
     def __init__(self) -> None:
         if not settings.OPENAI_API_KEY:
             raise AiClientError("OPENAI_API_KEY is not configured")
-        self._client = OpenAI(api_key=settings.OPENAI_API_KEY)
+        self._client = get_openai_client()
         self._model = settings.OPENAI_REWRITE_MODEL
         self._timeout = settings.AI_REWRITE_TIMEOUT_SECONDS
         self._retries = settings.AI_REWRITE_RETRIES
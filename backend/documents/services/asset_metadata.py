@@ -5,6 +5,10 @@ import re
 import struct
 from io import BytesIO
 
+SVG_WIDTH_PATTERN = re.compile(r'width\s*=\s*"([0-9.]+)', re.IGNORECASE)
+SVG_HEIGHT_PATTERN = re.compile(r'height\s*=\s*"([0-9.]+)', re.IGNORECASE)
+SVG_VIEWBOX_PATTERN = re.compile(r'viewBox\s*=\s*"([0-9.\s\-]+)"', re.IGNORECASE)
+
 
 def compute_sha256(payload: bytes) -> str:
     return hashlib.sha256(payload).hexdigest()
@@ -85,15 +89,11 @@ def _parse_svg_size(payload: bytes) -> tuple[int, int] | None:
     text = payload[:4096].decode("utf-8", errors="ignore")
     if "<svg" not in text.lower():
         return None
-    width_match = re.search(r'width\s*=\s*"([0-9.]+)', text, flags=re.IGNORECASE)
-    height_match = re.search(r'height\s*=\s*"([0-9.]+)', text, flags=re.IGNORECASE)
+    width_match = SVG_WIDTH_PATTERN.search(text)
+    height_match = SVG_HEIGHT_PATTERN.search(text)
     if width_match and height_match:
         return int(float(width_match.group(1))), int(float(height_match.group(1)))
-    viewbox = re.search(
-        r'viewBox\s*=\s*"([0-9.\s\-]+)"',
-        text,
-        flags=re.IGNORECASE,
-    )
+    viewbox = SVG_VIEWBOX_PATTERN.search(text)
     if viewbox:
         parts = [p for p in viewbox.group(1).replace(",", " ").split(" ") if p]
         if len(parts) == 4:
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+from collections import OrderedDict
 import hashlib
+import os
 from dataclasses import dataclass
 from pathlib import Path
+import threading
 from typing import BinaryIO, Protocol
 
 from django.conf import settings
@@ -18,6 +21,30 @@ from .variable_keys import (
 )
 
 
+# LRU of asset files already hashed in this process, keyed by path, inode, size, mtime, ctime and
+# the expected sha256. A hit skips re-hashing, so integrity is only as strong as that stat
+# fingerprint: rewriting a file bumps its ctime, which utime() cannot reset.
+MAX_VERIFIED_DIGESTS = 256
+_verified_digests: OrderedDict[tuple[str, int, int, int, int, str], None] = OrderedDict()
+_verified_digests_lock = threading.Lock()
+
+
+def _is_verified(fingerprint: tuple[str, int, int, int, int, str]) -> bool:
+    with _verified_digests_lock:
+        if fingerprint not in _verified_digests:
+            return False
+        _verified_digests.move_to_end(fingerprint)
+        return True
+
+
+def _mark_verified(fingerprint: tuple[str, int, int, int, int, str]) -> None:
+    with _verified_digests_lock:
+        _verified_digests[fingerprint] = None
+        _verified_digests.move_to_end(fingerprint)
+        while len(_verified_digests) > MAX_VERIFIED_DIGESTS:
+            _verified_digests.popitem(last=False)
+
+
 @dataclass(frozen=True)
 class AssetRef:
     id: str
@@ -71,7 +98,9 @@ class StorageAssetResolver:
             return None
 
         path = Path(asset.file_path)
-        size_bytes = path.stat().st_size if path.exists() else 0
+        size_bytes = asset.size_bytes
+        if size_bytes is None:
+            size_bytes = path.stat().st_size if path.exists() else 0
         return AssetRef(
             id=str(asset.id),
             handbook_id=asset.handbook_id,
@@ -90,10 +119,21 @@ class StorageAssetResolver:
 
     def load_buffer(self, asset: AssetRef) -> bytes:
         path = Path(asset.storage_path)
-        hasher = hashlib.sha256()
         total = 0
         chunks: list[bytes] = []
         with self.storage.open_read_stream(path) as stream:
+            stat = os.fstat(stream.fileno())
+            fingerprint = (
+                asset.storage_path,
+                stat.st_ino,
+                stat.st_size,
+                stat.st_mtime_ns,
+                stat.st_ctime_ns,
+                asset.sha256,
+            )
+            if asset.sha256 and stat.st_size <= self.max_buffer_bytes and _is_verified(fingerprint):
+                return stream.read()
+            hasher = hashlib.sha256()
             while True:
                 chunk = stream.read(64 * 1024)
                 if not chunk:
@@ -112,6 +152,8 @@ class StorageAssetResolver:
                 f"Asset hash mismatch for '{asset.filename}' ({asset.key})"
             )
 
+        if asset.sha256:
+            _mark_verified(fingerprint)
         return b"".join(chunks)
 
 
@@ -124,6 +124,8 @@ def asset_filename(asset: WorkspaceAsset) -> str:
 
 
 def asset_size_bytes(asset: WorkspaceAsset) -> int:
+    if asset.size_bytes is not None:
+        return asset.size_bytes
     path = Path(asset.file_path)
     if not path.exists():
         return 0
@@ -196,6 +198,7 @@ def save_asset_bytes(
         file_path=str(target),
         mime_type=normalized_mime,
         sha256=sha256,
+        size_bytes=len(payload),
         width=width,
         height=height,
     )
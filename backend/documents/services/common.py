@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from pathlib import Path, PurePosixPath
+import os
+from pathlib import Path
+import shutil
 
 from django.conf import settings
 
@@ -8,6 +10,7 @@ SUPPORTED_TEMPLATE_EXTS = {".docx", ".pptx", ".xlsx", ".md", ".txt", ".html", ".
 SUPPORTED_UPLOAD_EXTS = SUPPORTED_TEMPLATE_EXTS | {".zip"}
 SUPPORTED_IMAGE_EXTS = {".png", ".jpg", ".jpeg", ".svg", ".webp", ".gif"}
 TEXT_EXTS = {".md", ".txt", ".html", ".htm"}
+UNSAFE_PATH_PARTS = frozenset({"", ".", ".."})
 
 
 def documents_root() -> Path:
@@ -24,11 +27,26 @@ def sanitize_relative_path(path_value: str, fallback: str) -> str:
     if not raw:
         raw = fallback
 
-    posix = PurePosixPath(raw)
-    safe_parts = [part for part in posix.parts if part not in {"", ".", ".."}]
+    safe_parts = [part for part in raw.split("/") if part not in UNSAFE_PATH_PARTS]
     return "/".join(safe_parts) or fallback
 
 
+def link_uploaded_file(uploaded, destination: Path) -> bool:
+    """Hardlink a disk-backed upload into place (copying across filesystems); False for in-memory uploads."""
+    temporary_file_path = getattr(uploaded, "temporary_file_path", None)
+    if temporary_file_path is None:
+        return False
+    source = temporary_file_path()
+    destination.unlink(missing_ok=True)
+    try:
+        os.link(source, destination)
+    except OSError:
+        shutil.copyfile(source, destination)
+    # Django creates temporary uploads 0600; give the stored file the regular upload mode.
+    os.chmod(destination, settings.FILE_UPLOAD_PERMISSIONS or 0o644)
+    return True
+
+
 def ensure_within_handbook_path(handbook_id: str, rel_path: str) -> Path:
     root = handbook_root(handbook_id).resolve()
     full = (root / rel_path).resolve()
@@ -79,6 +79,8 @@ OUTPUT_STYLES: Final[list[dict[str, str]]] = [
     {"id": "long_form_explanation", "label": "Ausführliche Erklärung", "output_class": "long"},
 ]
 
+OUTPUT_STYLE_IDS: Final[frozenset[str]] = frozenset(item["id"] for item in OUTPUT_STYLES)
+
 REFERENCE_SCOPES: Final[list[str]] = ["handbook", "file", "placeholder"]
 SUPPORTED_LANGUAGES: Final[list[str]] = ["de-DE", "en-US"]
 
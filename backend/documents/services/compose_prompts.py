@@ -7,12 +7,16 @@ import re
 MAX_REFERENCE_BLOCK_CHARS = 2200
 MAX_FILE_CONTEXT_CHARS = 1800
 
+CODE_FENCE_PATTERN = re.compile(r"```+")
+CONTROL_CHAR_PATTERN = re.compile(r"[\u0000-\u0008\u000b\u000c\u000e-\u001f]+")
+BLANK_LINES_PATTERN = re.compile(r"\n{3,}")
+
 
 def _clean_text(value: str, *, limit: int) -> str:
     text = (value or "").replace("\x00", " ")
-    text = re.sub(r"```+", "`", text)
-    text = re.sub(r"[\u0000-\u0008\u000b\u000c\u000e-\u001f]+", " ", text)
-    text = re.sub(r"\n{3,}", "\n\n", text).strip()
+    text = CODE_FENCE_PATTERN.sub("`", text)
+    text = CONTROL_CHAR_PATTERN.sub(" ", text)
+    text = BLANK_LINES_PATTERN.sub("\n\n", text).strip()
     if len(text) > limit:
         text = text[: limit - 1].rstrip() + "…"
     return text
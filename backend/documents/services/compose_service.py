@@ -1,27 +1,36 @@
 from __future__ import annotations
 
 from dataclasses import asdict, dataclass
-import hashlib
+import heapq
 import json
 import logging
 import re
 from typing import Any
 
 from django.conf import settings
+from django.db.models import Exists, OuterRef, Prefetch, Q
 
 from documents.models import (
     Handbook,
     HandbookFile,
     Placeholder,
     PlaceholderGenerationAudit,
+    ReferenceChunk,
     ReferenceDocument,
     ReferenceDocumentLink,
 )
 
 from .ai_client import AiClient, AiClientError
-from .compose_capabilities import REFERENCE_SCOPES, SUPPORTED_LANGUAGES, get_capability_registry, get_output_styles
+from .compose_capabilities import (
+    OUTPUT_STYLE_IDS,
+    REFERENCE_SCOPES,
+    SUPPORTED_LANGUAGES,
+    get_capability_registry,
+    get_output_styles,
+)
 from .compose_prompts import build_compose_prompt
 from .placeholder_normalization import canonicalize_placeholder_key
+from .reference_extraction import NormalizedSection
 from .reference_service import (
     ReferenceServiceError,
     get_handbook_file_text_context,
@@ -59,6 +68,10 @@ LONG_HINTS = {
     "compliance",
 }
 SHORT_HINTS = {"title", "name", "owner", "rolle", "status", "cell", "bullet", "slide"}
+KEY_SEPARATOR_PATTERN = re.compile(r"[._-]+")
+TERM_PATTERN = re.compile(r"[A-Za-zÄÖÜäöüß][A-Za-zÄÖÜäöüß0-9_-]{2,}")
+TRAILING_NUMBER_PATTERN = re.compile(r"(\d+)$")
+SEARCH_TERM_SPLIT_PATTERN = re.compile(r"[^a-zA-Z0-9äöüÄÖÜß]+")
 TARGET_INTENT_PATTERNS: dict[str, tuple[str, ...]] = {
     "instruction": ("anweisung", "instruction", "durchführung", "umsetzung", "arbeitsanweisung"),
     "workflow_description": ("workflow", "prozess", "ablauf", "verfahrensablauf", "prozessbeschreibung"),
@@ -228,7 +241,7 @@ def suggested_output_class_for_placeholder(*, placeholder: Placeholder, handbook
     key = _canonicalize_placeholder_key(placeholder.key)
     if handbook_file.file_type == HandbookFile.FileType.PPTX:
         return "short"
-    pieces = set(re.split(r"[._-]+", key.lower()))
+    pieces = set(KEY_SEPARATOR_PATTERN.split(key.lower()))
     if pieces & LONG_HINTS:
         return "long"
     if pieces & SHORT_HINTS:
@@ -575,7 +588,7 @@ def _humanize_placeholder_label(raw: str) -> str:
 def _tokenize_terms(text: str) -> list[str]:
     return [
         token
-        for token in re.findall(r"[A-Za-zÄÖÜäöüß][A-Za-zÄÖÜäöüß0-9_-]{2,}", text.lower())
+        for token in TERM_PATTERN.findall(text.lower())
         if token not in STOPWORDS
     ]
 
@@ -758,10 +771,10 @@ def extract_handbook_file_context(
             section_kind=section.section_kind,
         )
         scored.append((score, section))
-    scored.sort(key=lambda item: item[0], reverse=True)
     max_sections = 1 if output_class == "short" else 2
     selected_sections = []
-    for score, section in scored[: max_sections + 2]:
+    # Only the best few sections are considered, so a bounded heap replaces a full sort.
+    for score, section in heapq.nlargest(max_sections + 2, scored, key=lambda item: item[0]):
         if score <= 0 and selected_sections:
             continue
         selected_sections.append(
@@ -836,7 +849,9 @@ def select_reference_context(
 
     document_scores: list[dict[str, object]] = []
     summary_contexts: list[ReferenceSummaryContext] = []
-    candidate_snippets: list[ReferenceSnippetContext] = []
+    candidates: list[tuple[float, int, ReferenceDocument, str | None, NormalizedSection]] = []
+    # Boilerplate sections (headers, legal notes) repeat across references; score each distinct one once.
+    block_scores: dict[tuple[str, str, str, tuple[str, ...]], float] = {}
     for document in docs:
         try:
             normalized = load_normalized_reference_document(document)
@@ -883,14 +898,19 @@ def select_reference_context(
             for item in document.chunks.all()
         }
         for section in normalized.sections:
-            section_score = _score_text_block(
-                title=section.title,
-                content=section.content,
-                terms=terms,
-                themes=section.themes,
-                target_intent=generation_context.target_context.target_intent,
-                section_kind=section.section_kind,
-            ) + document_score * 0.15
+            block_key = (section.title, section.content, section.section_kind, tuple(section.themes))
+            block_score = block_scores.get(block_key)
+            if block_score is None:
+                block_score = _score_text_block(
+                    title=section.title,
+                    content=section.content,
+                    terms=terms,
+                    themes=section.themes,
+                    target_intent=generation_context.target_context.target_intent,
+                    section_kind=section.section_kind,
+                )
+                block_scores[block_key] = block_score
+            section_score = block_score + document_score * 0.15
             if section.themes and generation_context.target_context.target_intent in section.themes:
                 section_score += 2.0
             if section.section_kind == "procedure" and generation_context.target_context.target_intent in {
@@ -898,44 +918,51 @@ def select_reference_context(
                 "workflow_description",
             }:
                 section_score += 1.5
-            ordinal = _ordinal_from_section_id(section.id)
-            candidate_snippets.append(
-                ReferenceSnippetContext(
-                    reference_document_id=str(document.id),
-                    reference_document_title=document.original_filename,
-                    chunk_id=chunk_id_by_ordinal.get(ordinal),
-                    title=section.title or document.original_filename,
-                    locator=section.locator,
-                    content=section.content,
-                    estimated_tokens=max(1, int(section.estimated_tokens or 0)),
-                    score=round(section_score, 3),
-                    use_reason=_build_use_reason(
-                        target_intent=generation_context.target_context.target_intent,
-                        themes=section.themes,
-                    ),
+            candidates.append(
+                (
+                    round(section_score, 3),
+                    max(1, int(section.estimated_tokens or 0)),
+                    document,
+                    chunk_id_by_ordinal.get(_ordinal_from_section_id(section.id)),
+                    section,
                 )
             )
 
-    candidate_snippets.sort(key=lambda item: (item.score, item.estimated_tokens), reverse=True)
+    # Most candidates never fit the budget, so snippet contexts are only built for the ones selected.
+    candidates.sort(key=lambda item: (item[0], item[1]), reverse=True)
     selected: list[ReferenceSnippetContext] = []
     total_tokens = 0
     per_doc_counts: dict[str, int] = {}
-    seen_hashes: set[str] = set()
-    for snippet in candidate_snippets:
-        doc_id = snippet.reference_document_id
+    seen_contents: set[str] = set()
+    for score, estimated_tokens, document, chunk_id, section in candidates:
+        doc_id = str(document.id)
         if per_doc_counts.get(doc_id, 0) >= 2 and len(per_doc_counts) < len(docs):
             continue
-        content_hash = hashlib.sha256(snippet.content.encode("utf-8")).hexdigest()
-        if content_hash in seen_hashes:
+        if section.content in seen_contents:
             continue
-        next_tokens = total_tokens + max(1, int(snippet.estimated_tokens or 0))
+        next_tokens = total_tokens + estimated_tokens
         if selected and next_tokens > max_tokens:
             continue
-        selected.append(snippet)
+        selected.append(
+            ReferenceSnippetContext(
+                reference_document_id=doc_id,
+                reference_document_title=document.original_filename,
+                chunk_id=chunk_id,
+                title=section.title or document.original_filename,
+                locator=section.locator,
+                content=section.content,
+                estimated_tokens=estimated_tokens,
+                score=score,
+                use_reason=_build_use_reason(
+                    target_intent=generation_context.target_context.target_intent,
+                    themes=section.themes,
+                ),
+            )
+        )
         per_doc_counts[doc_id] = per_doc_counts.get(doc_id, 0) + 1
-        seen_hashes.add(content_hash)
+        seen_contents.add(section.content)
         total_tokens = next_tokens
-        if len(selected) >= max_chunks:
+        if len(selected) >= max_chunks or total_tokens >= max_tokens:
             break
 
     fallback_path = "ranked_chunks"
@@ -987,19 +1014,27 @@ def _resolve_effective_reference_documents(
     if not selected_ids:
         return [], []
 
-    query = ReferenceDocument.objects.filter(
-        handbook=handbook,
-        id__in=selected_ids,
-    ).prefetch_related("chunks", "links")
-
-    handbook_q = {ReferenceDocumentLink.Scope.HANDBOOK}
-    file_q = handbook_q | {ReferenceDocumentLink.Scope.FILE}
-    placeholder_q = file_q | {ReferenceDocumentLink.Scope.PLACEHOLDER}
-    allowed_scopes = handbook_q
-    if reference_scope == ReferenceDocumentLink.Scope.FILE:
-        allowed_scopes = file_q
-    elif reference_scope == ReferenceDocumentLink.Scope.PLACEHOLDER:
-        allowed_scopes = placeholder_q
+    allowed_links = Q(scope=ReferenceDocumentLink.Scope.HANDBOOK)
+    if reference_scope in (ReferenceDocumentLink.Scope.FILE, ReferenceDocumentLink.Scope.PLACEHOLDER):
+        allowed_links |= Q(scope=ReferenceDocumentLink.Scope.FILE, handbook_file_id=handbook_file.id)
+    if reference_scope == ReferenceDocumentLink.Scope.PLACEHOLDER:
+        allowed_links |= Q(scope=ReferenceDocumentLink.Scope.PLACEHOLDER, placeholder_id=placeholder.id)
+
+    # The scope check runs as an EXISTS subquery, so links never need to be fetched.
+    query = (
+        ReferenceDocument.objects.filter(
+            handbook=handbook,
+            id__in=selected_ids,
+        )
+        .annotate(
+            scope_allowed=Exists(
+                ReferenceDocumentLink.objects.filter(allowed_links, reference_document=OuterRef("pk"))
+            )
+        )
+        .prefetch_related(
+            Prefetch("chunks", queryset=ReferenceChunk.objects.only("id", "reference_document_id", "ordinal"))
+        )
+    )
 
     docs_by_id = {str(document.id): document for document in query}
     docs = []
@@ -1025,20 +1060,7 @@ def _resolve_effective_reference_documents(
                 }
             )
             continue
-        allowed = False
-        for link in document.links.all():
-            if link.scope not in allowed_scopes:
-                continue
-            if link.scope == ReferenceDocumentLink.Scope.HANDBOOK:
-                allowed = True
-                break
-            if link.scope == ReferenceDocumentLink.Scope.FILE and link.handbook_file_id == handbook_file.id:
-                allowed = True
-                break
-            if link.scope == ReferenceDocumentLink.Scope.PLACEHOLDER and link.placeholder_id == placeholder.id:
-                allowed = True
-                break
-        if not allowed:
+        if not document.scope_allowed:
             skipped.append(
                 {
                     "reference_document_id": str(document.id),
@@ -1059,8 +1081,7 @@ def _build_search_terms(
     target_intent: str | None = None,
     tenant_context: TenantContext | None = None,
 ) -> list[str]:
-    raw_terms = re.split(
-        r"[^a-zA-Z0-9äöüÄÖÜß]+",
+    raw_terms = SEARCH_TERM_SPLIT_PATTERN.split(
         " ".join(
             [
                 placeholder_key,
@@ -1150,7 +1171,7 @@ def _score_reference_document(
 
 
 def _ordinal_from_section_id(section_id: str) -> int:
-    match = re.search(r"(\d+)$", section_id)
+    match = TRAILING_NUMBER_PATTERN.search(section_id)
     if not match:
         return 0
     return int(match.group(1))
@@ -1185,8 +1206,7 @@ def _validate_language(language: str) -> str:
 
 def _validate_output_style(output_style: str) -> str:
     normalized = (output_style or "").strip() or "formal"
-    allowed = {item["id"] for item in get_output_styles()}
-    if normalized not in allowed:
+    if normalized not in OUTPUT_STYLE_IDS:
         raise ComposeValidationError("Unsupported output_style", "INVALID_OUTPUT_STYLE")
     return normalized
 
@@ -1,16 +1,23 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections import defaultdict
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import ExitStack
+from dataclasses import dataclass, field
+from functools import partial
 import hashlib
 from io import BytesIO
+from itertools import chain, repeat
 import json
 import logging
 import mimetypes
 from pathlib import Path, PurePosixPath
 import re
 import shutil
-from typing import Callable
-from zipfile import ZIP_DEFLATED, BadZipFile, ZipFile
+from typing import BinaryIO, Callable
+import uuid
+from zipfile import ZIP_DEFLATED, ZIP_STORED, BadZipFile, ZipFile, ZipInfo
 
 from django.conf import settings
 from django.db import transaction
@@ -26,6 +33,7 @@ from documents.models import (
     PlaceholderParseCache,
     PlaceholderValue,
     VersionSnapshot,
+    WorkspaceAsset,
 )
 
 from .compose_service import (
@@ -44,6 +52,7 @@ from .asset_service import (
     save_asset_bytes,
 )
 from .asset_metadata import detect_image_dimensions
+from .common import link_uploaded_file
 from .inject_docx import inject_docx_assets
 from .inject_pptx import inject_pptx_assets
 from .inject_xlsx import inject_xlsx_assets
@@ -52,12 +61,14 @@ from .placeholder_normalization import (
     canonicalize_placeholder_key as normalize_placeholder_key,
     is_current_date_placeholder,
 )
-from .storage import LocalFilesystemStorage
+from .storage import LocalFilesystemStorage, StorageReadError
 from .variable_keys import (
     CANONICAL_ASSET_LOGO,
     CANONICAL_ASSET_SIGNATURE,
     aliases_for_canonical,
 )
+from .worker_pool import get_worker_pool, reset_worker_pool, should_use_worker_pool, worker_pool_size
+from template_engine.ooxml import OOXML_COMPRESSLEVEL, TOKEN_MARKERS
 from template_engine.ooxml_normalizer import normalize_ooxml_xml
 
 
@@ -66,11 +77,23 @@ logger = logging.getLogger(__name__)
 MAX_ZIP_ENTRIES = 3000
 MAX_ZIP_TOTAL_UNCOMPRESSED_BYTES = 400 * 1024 * 1024
 MAX_ZIP_ENTRY_BYTES = 100 * 1024 * 1024
+COPY_BUFFER_SIZE = 1024 * 1024
+# Bump when export rendering changes so cached outputs are not reused.
+EXPORT_CACHE_VERSION = 1
 
 ASSET_KEYS = {CANONICAL_ASSET_LOGO, CANONICAL_ASSET_SIGNATURE}
-PARSEABLE_EXTS = {".docx", ".pptx", ".xlsx"}
+PARSEABLE_EXTS = frozenset({".docx", ".pptx", ".xlsx"})
+FILE_TYPE_BY_EXT = {
+    ".docx": HandbookFile.FileType.DOCX,
+    ".pptx": HandbookFile.FileType.PPTX,
+    ".xlsx": HandbookFile.FileType.XLSX,
+}
+JUNK_ROOT_DIRS = frozenset({"__MACOSX"})
+JUNK_BASENAMES = frozenset({".DS_Store", "Thumbs.db"})
+PLACEHOLDER_VALUE_SOURCES = frozenset(PlaceholderValue.Source.values)
 
 PLACEHOLDER_PATTERN = re.compile(r"\{\{\s*([^{}]+?)\s*\}\}")
+PLACEHOLDER_BYTES_PATTERN = re.compile(rb"\{\{\s*([^{}]+?)\s*\}\}")
 LEGACY_ASSET_PATTERN = re.compile(
     r"(?<!\\)(\[(LOGO|SIGNATURE)\]|__ASSET_(LOGO|SIGNATURE)__)",
     re.IGNORECASE,
@@ -132,6 +155,11 @@ def canonicalize_placeholder_key(raw: str) -> str:
     return normalize_placeholder_key(raw)
 
 
+CANONICAL_CLIENT_TEXT_VALUE_GETTERS: tuple[tuple[str, Callable[[Client], str]], ...] = tuple(
+    (canonicalize_placeholder_key(alias), getter) for alias, getter in CLIENT_TEXT_VALUE_GETTERS.items()
+)
+
+
 def _decode_zip_entry_filename(info) -> str:
     """Correctly decode a ZIP entry filename.
 
@@ -188,29 +216,19 @@ def _safe_zip_path(name: str) -> str | None:
 
 
 def _is_junk_entry(safe_path: str) -> bool:
-    parts = [part for part in safe_path.split("/") if part]
-    if not parts:
+    stripped = safe_path.strip("/")
+    if not stripped:
         return True
-    if parts[0] == "__MACOSX":
+    root, _, _ = stripped.partition("/")
+    if root in JUNK_ROOT_DIRS:
         return True
 
-    basename = parts[-1]
-    if basename in {".DS_Store", "Thumbs.db"}:
-        return True
-    if basename.startswith("._"):
-        return True
-    return False
+    basename = stripped.rpartition("/")[2]
+    return basename in JUNK_BASENAMES or basename.startswith("._")
 
 
 def _file_type_from_ext(ext: str) -> str:
-    lowered = ext.lower()
-    if lowered == ".docx":
-        return HandbookFile.FileType.DOCX
-    if lowered == ".pptx":
-        return HandbookFile.FileType.PPTX
-    if lowered == ".xlsx":
-        return HandbookFile.FileType.XLSX
-    return HandbookFile.FileType.OTHER
+    return FILE_TYPE_BY_EXT.get(ext.lower(), HandbookFile.FileType.OTHER)
 
 
 def _is_target_xml(ext: str, name: str) -> bool:
@@ -228,6 +246,8 @@ def _extract_placeholders_from_text(
     source: str,
 ) -> dict[str, list[dict[str, object]]]:
     collected: dict[str, list[dict[str, object]]] = {}
+    if "{{" not in text and "[" not in text and "__" not in text:
+        return collected
 
     for match in PLACEHOLDER_PATTERN.finditer(text):
         key = canonicalize_placeholder_key(match.group(1) or "")
@@ -258,15 +278,22 @@ def _extract_placeholders_from_text(
     return collected
 
 
-def extract_placeholders_from_ooxml_bytes(payload: bytes, ext: str) -> dict[str, list[dict[str, object]]]:
+def extract_placeholders_from_ooxml_bytes(
+    payload: bytes | BinaryIO | Path,
+    ext: str,
+) -> dict[str, list[dict[str, object]]]:
     collected: dict[str, list[dict[str, object]]] = {}
 
-    with ZipFile(BytesIO(payload), "r") as archive:
+    source = BytesIO(payload) if isinstance(payload, bytes) else payload
+    with ZipFile(source, "r") as archive:
         for name in sorted(archive.namelist()):
             if not _is_target_xml(ext, name):
                 continue
 
-            xml = archive.read(name).decode("utf-8", errors="ignore")
+            raw = archive.read(name)
+            if not any(marker in raw for marker in TOKEN_MARKERS):
+                continue
+            xml = raw.decode("utf-8", errors="ignore")
             if ext in {".docx", ".pptx"}:
                 xml = normalize_ooxml_xml(xml, ext.lstrip("."))
 
@@ -277,32 +304,70 @@ def extract_placeholders_from_ooxml_bytes(payload: bytes, ext: str) -> dict[str,
     return collected
 
 
-def _replace_placeholders_in_text(text: str, values: dict[str, str]) -> str:
+def _placeholder_replacement(expression: str, values: dict[str, str]) -> str:
+    key = canonicalize_placeholder_key(expression)
+    if not key or key in ASSET_KEYS:
+        return ""
+    value = values.get(key)
+    return str(value).strip() if value is not None else ""
+
+
+def _replace_placeholders_in_text(
+    text: str,
+    values: dict[str, str],
+    *,
+    resolved: dict[str, str] | None = None,
+) -> str:
+    if "{{" not in text:
+        return text
+    replacements = resolved if resolved is not None else {}
+
     def _replacement(match: re.Match[str]) -> str:
-        key = canonicalize_placeholder_key(match.group(1) or "")
-        if not key or key in ASSET_KEYS:
-            return match.group(0)
-        value = values.get(key)
-        if value is None:
-            return match.group(0)
-        cleaned = str(value).strip()
-        if cleaned == "":
-            return match.group(0)
-        return cleaned
+        raw = match.group(0)
+        cached = replacements.get(raw)
+        if cached is not None:
+            return cached
+
+        replacement = _placeholder_replacement(match.group(1) or "", values) or raw
+        replacements[raw] = replacement
+        return replacement
 
     return PLACEHOLDER_PATTERN.sub(_replacement, text)
 
 
+def _replace_placeholders_in_xml_bytes(
+    xml: bytes,
+    values: dict[str, str],
+    *,
+    resolved: dict[bytes, bytes],
+) -> bytes:
+    # Same substitution as _replace_placeholders_in_text, without a decode/encode round trip.
+    def _replacement(match: re.Match[bytes]) -> bytes:
+        raw = match.group(0)
+        cached = resolved.get(raw)
+        if cached is not None:
+            return cached
+
+        value = _placeholder_replacement(match.group(1).decode("utf-8", errors="ignore"), values)
+        replacement = value.encode("utf-8") if value else raw
+        resolved[raw] = replacement
+        return replacement
+
+    return PLACEHOLDER_BYTES_PATTERN.sub(_replacement, xml)
+
+
 def replace_text_placeholders_in_ooxml_bytes(
     payload: bytes,
     ext: str,
     values: dict[str, str],
+    *,
+    resolved: dict[str, str] | None = None,
+    resolved_bytes: dict[bytes, bytes] | None = None,
 ) -> bytes:
     ext = ext.lower()
-    if ext not in PARSEABLE_EXTS:
+    if ext not in PARSEABLE_EXTS or not values:
         return payload
 
-    output = BytesIO()
     try:
         archive_in = ZipFile(BytesIO(payload), "r")
     except BadZipFile:
@@ -311,66 +376,110 @@ def replace_text_placeholders_in_ooxml_bytes(
         logger.warning("replace_text_placeholders: payload is not a valid ZIP (%s), skipping", ext)
         return payload
 
+    if resolved is None:
+        resolved = {}
+    if resolved_bytes is None:
+        resolved_bytes = {}
+    rendered: dict[str, bytes] = {}
     with archive_in:
+        for info in archive_in.infolist():
+            if not _is_target_xml(ext, info.filename):
+                continue
+            raw = archive_in.read(info.filename)
+            if b"{{" not in raw:
+                continue
+            if ext == ".xlsx":
+                # Spreadsheet cells need no run normalization, so patch the bytes directly.
+                encoded = _replace_placeholders_in_xml_bytes(raw, values, resolved=resolved_bytes)
+            else:
+                xml = normalize_ooxml_xml(raw.decode("utf-8", errors="ignore"), ext.lstrip("."))
+                encoded = _replace_placeholders_in_text(xml, values, resolved=resolved).encode("utf-8")
+            if encoded != raw:
+                rendered[info.filename] = encoded
+
+        if not rendered:
+            return payload
+
+        output = BytesIO()
         with ZipFile(output, "w", compression=ZIP_DEFLATED) as archive_out:
             for info in archive_in.infolist():
-                raw = archive_in.read(info.filename)
-                if _is_target_xml(ext, info.filename):
-                    xml = raw.decode("utf-8", errors="ignore")
-                    if ext in {".docx", ".pptx"}:
-                        xml = normalize_ooxml_xml(xml, ext.lstrip("."))
-                    xml = _replace_placeholders_in_text(xml, values)
-                    raw = xml.encode("utf-8")
-                archive_out.writestr(info, raw)
+                raw = rendered.get(info.filename)
+                if raw is None:
+                    raw = archive_in.read(info.filename)
+                archive_out.writestr(info, raw, compresslevel=OOXML_COMPRESSLEVEL)
     return output.getvalue()
 
 
-def _resolved_text_keys(handbook: Handbook) -> set[str]:
-    values = PlaceholderValue.objects.filter(handbook=handbook)
-    return {
-        canonicalize_placeholder_key(item.key)
-        for item in values
-        if isinstance(item.value_text, str) and item.value_text.strip()
-    }
+def _resolved_text_keys(handbook: Handbook) -> frozenset[str]:
+    values = PlaceholderValue.objects.filter(handbook=handbook).values_list("key", "value_text")
+    return frozenset(
+        canonicalize_placeholder_key(key)
+        for key, value_text in values
+        if isinstance(value_text, str) and value_text.strip()
+    )
 
 
-def _resolved_asset_keys(handbook: Handbook) -> set[str]:
-    resolved: set[str] = set()
-    if get_active_asset(handbook_id=str(handbook.id), asset_type="logo") is not None:
-        resolved.add(CANONICAL_ASSET_LOGO)
-    if get_active_asset(handbook_id=str(handbook.id), asset_type="signature") is not None:
-        resolved.add(CANONICAL_ASSET_SIGNATURE)
-    return resolved
+def _resolved_asset_keys(handbook: Handbook) -> frozenset[str]:
+    asset_types = (
+        WorkspaceAsset.objects.filter(
+            handbook_id=str(handbook.id),
+            asset_type__in=[WorkspaceAsset.AssetType.LOGO, WorkspaceAsset.AssetType.SIGNATURE],
+            deleted_at__isnull=True,
+        )
+        .values_list("asset_type", flat=True)
+        .distinct()
+    )
+    canonical_by_type = {
+        WorkspaceAsset.AssetType.LOGO: CANONICAL_ASSET_LOGO,
+        WorkspaceAsset.AssetType.SIGNATURE: CANONICAL_ASSET_SIGNATURE,
+    }
+    return frozenset(canonical_by_type[item] for item in asset_types)
 
 
-def _resolved_keys(handbook: Handbook) -> set[str]:
+def _resolved_keys(handbook: Handbook) -> frozenset[str]:
     return _resolved_text_keys(handbook) | _resolved_asset_keys(handbook)
 
 
-def _update_file_completion(
-    handbook: Handbook,
+def _apply_file_completion(
     handbook_file: HandbookFile,
-    *,
-    resolved_keys: set[str] | None = None,
-) -> None:
-    placeholders = list(Placeholder.objects.filter(handbook_file=handbook_file).only("key"))
-    resolved = resolved_keys if resolved_keys is not None else _resolved_keys(handbook)
-    total = len(placeholders)
-    resolved_count = sum(1 for item in placeholders if canonicalize_placeholder_key(item.key) in resolved)
+    placeholder_keys: list[str],
+    resolved: frozenset[str],
+) -> bool:
+    total = len(placeholder_keys)
+    resolved_count = sum(1 for key in placeholder_keys if canonicalize_placeholder_key(key) in resolved)
 
     if (
         handbook_file.placeholder_total == total
         and handbook_file.placeholder_resolved == resolved_count
     ):
-        return
+        return False
 
     handbook_file.placeholder_total = total
     handbook_file.placeholder_resolved = resolved_count
-    handbook_file.save(update_fields=["placeholder_total", "placeholder_resolved", "updated_at"])
+    return True
+
+
+def _update_file_completion(
+    handbook: Handbook,
+    handbook_file: HandbookFile,
+    *,
+    resolved_keys: frozenset[str] | None = None,
+) -> None:
+    placeholder_keys = list(handbook_file.placeholders.values_list("key", flat=True))
+    resolved = resolved_keys if resolved_keys is not None else _resolved_keys(handbook)
+    if _apply_file_completion(handbook_file, placeholder_keys, resolved):
+        handbook_file.save(update_fields=["placeholder_total", "placeholder_resolved", "updated_at"])
 
 
-def _update_handbook_status(handbook: Handbook, *, resolved_keys: set[str] | None = None) -> None:
-    files_count = HandbookFile.objects.filter(handbook=handbook).count()
+def _update_handbook_status(
+    handbook: Handbook,
+    *,
+    resolved_keys: frozenset[str] | None = None,
+    files_count: int | None = None,
+    required_keys: list[str] | None = None,
+) -> None:
+    if files_count is None:
+        files_count = HandbookFile.objects.filter(handbook=handbook).count()
     if files_count == 0:
         if handbook.status != Handbook.Status.DRAFT:
             handbook.status = Handbook.Status.DRAFT
@@ -378,11 +487,12 @@ def _update_handbook_status(handbook: Handbook, *, resolved_keys: set[str] | Non
         return
 
     resolved = resolved_keys if resolved_keys is not None else _resolved_keys(handbook)
-    required = list(
-        Placeholder.objects.filter(handbook_file__handbook=handbook, required=True).only("key")
-    )
-    required_total = len(required)
-    required_resolved = sum(1 for item in required if canonicalize_placeholder_key(item.key) in resolved)
+    if required_keys is None:
+        required_keys = list(
+            Placeholder.objects.filter(handbook_file__handbook=handbook, required=True).values_list("key", flat=True)
+        )
+    required_total = len(required_keys)
+    required_resolved = sum(1 for key in required_keys if canonicalize_placeholder_key(key) in resolved)
 
     current = handbook.status
     next_status = (
@@ -395,11 +505,34 @@ def _update_handbook_status(handbook: Handbook, *, resolved_keys: set[str] | Non
         handbook.save(update_fields=["status", "updated_at"])
 
 
-def refresh_handbook_completion(*, handbook: Handbook) -> None:
+def refresh_handbook_completion(*, handbook: Handbook, files: list[HandbookFile] | None = None) -> None:
     resolved = _resolved_keys(handbook)
-    for handbook_file in HandbookFile.objects.filter(handbook=handbook).order_by("path_in_handbook"):
-        _update_file_completion(handbook, handbook_file, resolved_keys=resolved)
-    _update_handbook_status(handbook, resolved_keys=resolved)
+    keys_by_file: defaultdict[object, list[str]] = defaultdict(list)
+    required_keys: list[str] = []
+    for file_id, key, required in Placeholder.objects.filter(handbook_file__handbook=handbook).values_list(
+        "handbook_file_id", "key", "required"
+    ):
+        keys_by_file[file_id].append(key)
+        if required:
+            required_keys.append(key)
+
+    if files is None:
+        files = list(HandbookFile.objects.filter(handbook=handbook).order_by("path_in_handbook"))
+    now = timezone.now()
+    changed: list[HandbookFile] = []
+    for handbook_file in files:
+        if _apply_file_completion(handbook_file, keys_by_file.get(handbook_file.id, []), resolved):
+            handbook_file.updated_at = now
+            changed.append(handbook_file)
+    if changed:
+        HandbookFile.objects.bulk_update(changed, ["placeholder_total", "placeholder_resolved", "updated_at"])
+
+    _update_handbook_status(
+        handbook,
+        resolved_keys=resolved,
+        files_count=len(files),
+        required_keys=required_keys,
+    )
 
 
 def list_handbook_file_groups_for_client(*, customer_id: str) -> list[dict[str, object]]:
@@ -538,6 +671,7 @@ def _build_completion_state(
     required_placeholders = list(
         Placeholder.objects.filter(handbook_file__handbook=handbook, required=True)
         .select_related("handbook_file")
+        .only("handbook_file__path_in_handbook", "key", "kind")
         .order_by("handbook_file__path_in_handbook", "key")
     )
     value_map = {
@@ -606,23 +740,23 @@ def _build_completion_state(
         )
 
     files = list(HandbookFile.objects.filter(handbook=handbook).order_by("path_in_handbook"))
-    file_checksums = [
-        {
-            "file_id": str(item.id),
-            "path": item.path_in_handbook,
-            "checksum": item.checksum,
-            "file_type": item.file_type,
-        }
-        for item in files
-    ]
-
+    file_checksums: list[dict[str, object]] = []
     completion_files: list[dict[str, object]] = []
     for item in files:
-        base = files_completion.get(str(item.id))
+        file_id = str(item.id)
+        file_checksums.append(
+            {
+                "file_id": file_id,
+                "path": item.path_in_handbook,
+                "checksum": item.checksum,
+                "file_type": item.file_type,
+            }
+        )
+        base = files_completion.get(file_id)
         if base is None:
             completion_files.append(
                 {
-                    "file_id": str(item.id),
+                    "file_id": file_id,
                     "path": item.path_in_handbook,
                     "required_total": 0,
                     "required_resolved": 0,
@@ -634,7 +768,7 @@ def _build_completion_state(
         required_file_resolved = int(base["required_resolved"])
         completion_files.append(
             {
-                "file_id": str(item.id),
+                "file_id": file_id,
                 "path": item.path_in_handbook,
                 "required_total": required_file_total,
                 "required_resolved": required_file_resolved,
@@ -834,23 +968,24 @@ def create_handbook(*, customer_id: str, handbook_type: str) -> Handbook:
     if not Client.objects.filter(id=customer_id).exists():
         raise HandbookServiceError("Customer not found")
 
+    # The id is chosen up front so the storage path is known before the single INSERT;
+    # the directory is only created once that INSERT has succeeded.
+    handbook_id = uuid.uuid4()
+    root = (Path(settings.DOCUMENTS_DATA_ROOT) / "handbooks" / str(handbook_id)).resolve()
     handbook = Handbook.objects.create(
+        id=handbook_id,
         customer_id=customer_id,
         type=handbook_type,
         status=Handbook.Status.DRAFT,
-        root_storage_path="",
+        root_storage_path=str(root),
     )
-
-    root = Path(settings.DOCUMENTS_DATA_ROOT) / "handbooks" / str(handbook.id)
     root.mkdir(parents=True, exist_ok=True)
-    handbook.root_storage_path = str(root.resolve())
-    handbook.save(update_fields=["root_storage_path", "updated_at"])
     return handbook
 
 
 def _build_client_text_values(customer: Client) -> dict[str, str]:
     values: dict[str, str] = {}
-    for alias, getter in CLIENT_TEXT_VALUE_GETTERS.items():
+    for key, getter in CANONICAL_CLIENT_TEXT_VALUE_GETTERS:
         try:
             raw = getter(customer)
         except Exception:  # noqa: BLE001
@@ -860,7 +995,7 @@ def _build_client_text_values(customer: Client) -> dict[str, str]:
         cleaned = str(raw).strip()
         if not cleaned:
             continue
-        values[canonicalize_placeholder_key(alias)] = cleaned
+        values[key] = cleaned
     return values
 
 
@@ -1021,6 +1156,8 @@ def autofill_placeholders_from_client(*, handbook: Handbook) -> None:
         **_build_system_default_values(handbook=handbook),
     }
 
+    to_create: list[PlaceholderValue] = []
+    to_update: list[PlaceholderValue] = []
     for key in sorted(placeholder_keys):
         if key in ASSET_KEYS:
             continue
@@ -1040,20 +1177,29 @@ def autofill_placeholders_from_client(*, handbook: Handbook) -> None:
                 continue
 
         if existing is None:
-            created = PlaceholderValue.objects.create(
-                handbook=handbook,
-                key=key,
-                value_text=imported_value,
-                asset_id=None,
-                source=PlaceholderValue.Source.IMPORTED,
+            to_create.append(
+                PlaceholderValue(
+                    handbook=handbook,
+                    key=key,
+                    value_text=imported_value,
+                    asset_id=None,
+                    source=PlaceholderValue.Source.IMPORTED,
+                )
             )
-            existing_values[key] = created
             continue
 
         existing.value_text = imported_value
         existing.asset_id = None
         existing.source = PlaceholderValue.Source.IMPORTED
-        existing.save(update_fields=["value_text", "asset_id", "source", "updated_at"])
+        to_update.append(existing)
+
+    if to_create:
+        PlaceholderValue.objects.bulk_create(to_create)
+    if to_update:
+        now = timezone.now()
+        for item in to_update:
+            item.updated_at = now
+        PlaceholderValue.objects.bulk_update(to_update, ["value_text", "asset_id", "source", "updated_at"])
 
     decode_cache: dict[str, tuple[bytes, str, str]] = {}
     asset_inputs = {
@@ -1096,6 +1242,109 @@ def autofill_placeholders_from_client(*, handbook: Handbook) -> None:
         )
 
 
+def _extract_placeholders_from_file(path: str, ext: str) -> dict[str, list[dict[str, object]]]:
+    # May run in a pooled worker: reads parts straight from the extracted original, no ORM access.
+    return extract_placeholders_from_ooxml_bytes(Path(path), ext)
+
+
+def _completed_future(fn: Callable[..., object], *args: object) -> Future:
+    future: Future = Future()
+    try:
+        future.set_result(fn(*args))
+    except Exception as exc:  # noqa: BLE001
+        future.set_exception(exc)
+    return future
+
+
+def _parse_uploaded_files(handbook_files: list[HandbookFile]) -> None:
+    extracted_by_checksum: dict[tuple[str, str], dict[str, list[dict[str, object]]]] = {}
+    for entry in PlaceholderParseCache.objects.filter(
+        checksum__in={item.checksum for item in handbook_files}
+    ):
+        if isinstance(entry.placeholders, dict):
+            extracted_by_checksum[(entry.checksum, entry.file_type)] = {
+                str(key): list(value) if isinstance(value, list) else []
+                for key, value in entry.placeholders.items()
+            }
+
+    # Identical files share one parse; only cache misses reach the worker pool.
+    misses: dict[tuple[str, str], HandbookFile] = {}
+    for item in handbook_files:
+        cache_key = (item.checksum, item.file_type)
+        if cache_key not in extracted_by_checksum:
+            misses.setdefault(cache_key, item)
+
+    failures: dict[tuple[str, str], str] = {}
+    cache_entries: list[PlaceholderParseCache] = []
+    submit = get_worker_pool().submit if should_use_worker_pool(len(misses)) else _completed_future
+    try:
+        futures = {
+            cache_key: submit(
+                _extract_placeholders_from_file,
+                item.original_blob_ref,
+                Path(item.path_in_handbook).suffix.lower(),
+            )
+            for cache_key, item in misses.items()
+        }
+        for cache_key, future in futures.items():
+            try:
+                extracted = future.result()
+            except BrokenProcessPool:
+                raise
+            except (BadZipFile, ValueError, RuntimeError) as exc:
+                failures[cache_key] = str(exc)
+                continue
+            extracted_by_checksum[cache_key] = extracted
+            cache_entries.append(
+                PlaceholderParseCache(checksum=cache_key[0], file_type=cache_key[1], placeholders=extracted)
+            )
+    except BrokenProcessPool:
+        reset_worker_pool()
+        raise
+
+    if cache_entries:
+        PlaceholderParseCache.objects.bulk_create(
+            cache_entries,
+            update_conflicts=True,
+            unique_fields=["checksum", "file_type"],
+            update_fields=["placeholders", "updated_at"],
+        )
+
+    placeholders: list[Placeholder] = []
+    for handbook_file in handbook_files:
+        cache_key = (handbook_file.checksum, handbook_file.file_type)
+        if cache_key in failures:
+            handbook_file.parse_status = HandbookFile.ParseStatus.FAILED
+            handbook_file.parse_error = failures[cache_key]
+            continue
+        extracted = extracted_by_checksum[cache_key]
+        placeholders.extend(
+            Placeholder(
+                handbook_file=handbook_file,
+                key=key,
+                kind=(Placeholder.Kind.ASSET if key in ASSET_KEYS else Placeholder.Kind.TEXT),
+                required=True,
+                occurrences=len(locations),
+                meta={"locations": locations[:1000]},
+            )
+            for key, locations in sorted(extracted.items())
+        )
+        handbook_file.parse_status = HandbookFile.ParseStatus.PARSED
+        handbook_file.placeholder_total = len(extracted)
+        handbook_file.placeholder_resolved = 0
+
+    if placeholders:
+        Placeholder.objects.bulk_create(placeholders, batch_size=1000)
+    if handbook_files:
+        now = timezone.now()
+        for handbook_file in handbook_files:
+            handbook_file.updated_at = now
+        HandbookFile.objects.bulk_update(
+            handbook_files,
+            ["parse_status", "parse_error", "placeholder_total", "placeholder_resolved", "updated_at"],
+        )
+
+
 @transaction.atomic
 def upload_handbook_zip(*, handbook: Handbook, uploaded) -> UploadZipResult:
     filename = str(getattr(uploaded, "name", "")).strip()
@@ -1111,18 +1360,20 @@ def upload_handbook_zip(*, handbook: Handbook, uploaded) -> UploadZipResult:
     originals_dir.mkdir(parents=True, exist_ok=True)
 
     uploaded_zip_path = uploads_dir / "original-upload.zip"
-    with uploaded_zip_path.open("wb") as handle:
-        if hasattr(uploaded, "chunks"):
-            for chunk in uploaded.chunks():
-                handle.write(chunk)
-        else:
-            handle.write(uploaded.read())
+    if not link_uploaded_file(uploaded, uploaded_zip_path):
+        with uploaded_zip_path.open("wb") as handle:
+            if hasattr(uploaded, "chunks"):
+                for chunk in uploaded.chunks():
+                    handle.write(chunk)
+            else:
+                handle.write(uploaded.read())
 
     HandbookFile.objects.filter(handbook=handbook).delete()
     PlaceholderValue.objects.filter(handbook=handbook).delete()
     VersionSnapshot.objects.filter(handbook=handbook).delete()
 
     files: list[HandbookFile] = []
+    to_parse: list[HandbookFile] = []
     warnings: list[dict[str, str]] = []
 
     with ZipFile(uploaded_zip_path, "r") as archive:
@@ -1178,100 +1429,58 @@ def upload_handbook_zip(*, handbook: Handbook, uploaded) -> UploadZipResult:
                 continue
 
             dest_path.parent.mkdir(parents=True, exist_ok=True)
+            ext = Path(safe_path).suffix.lower()
             hasher = hashlib.sha256()
             size = 0
             with archive.open(info, "r") as source, dest_path.open("wb") as target:
                 while True:
-                    chunk = source.read(64 * 1024)
+                    chunk = source.read(COPY_BUFFER_SIZE)
                     if not chunk:
                         break
                     target.write(chunk)
                     hasher.update(chunk)
                     size += len(chunk)
 
-            ext = Path(safe_path).suffix.lower()
             file_type = _file_type_from_ext(ext)
             mime_type = mimetypes.guess_type(safe_path)[0] or "application/octet-stream"
 
-            handbook_file = HandbookFile.objects.create(
+            parseable = ext in PARSEABLE_EXTS
+            handbook_file = HandbookFile(
                 handbook=handbook,
                 path_in_handbook=safe_path,
                 file_type=file_type,
                 original_blob_ref=str(dest_path),
                 working_blob_ref="",
-                parse_status=HandbookFile.ParseStatus.PENDING,
+                parse_status=HandbookFile.ParseStatus.PENDING if parseable else HandbookFile.ParseStatus.PARSED,
                 checksum=hasher.hexdigest(),
                 size=size,
                 mime=mime_type,
             )
-
-            if ext in PARSEABLE_EXTS:
-                try:
-                    cache_entry = PlaceholderParseCache.objects.filter(
-                        checksum=hasher.hexdigest(),
-                        file_type=file_type,
-                    ).first()
-                    extracted: dict[str, list[dict[str, object]]]
-                    if cache_entry and isinstance(cache_entry.placeholders, dict):
-                        extracted = {
-                            str(key): list(value) if isinstance(value, list) else []
-                            for key, value in cache_entry.placeholders.items()
-                        }
-                    else:
-                        payload = dest_path.read_bytes()
-                        extracted = extract_placeholders_from_ooxml_bytes(payload, ext)
-                        PlaceholderParseCache.objects.update_or_create(
-                            checksum=hasher.hexdigest(),
-                            file_type=file_type,
-                            defaults={"placeholders": extracted},
-                        )
-                    placeholders = [
-                        Placeholder(
-                            handbook_file=handbook_file,
-                            key=key,
-                            kind=(Placeholder.Kind.ASSET if key in ASSET_KEYS else Placeholder.Kind.TEXT),
-                            required=True,
-                            occurrences=len(locations),
-                            meta={"locations": locations[:1000]},
-                        )
-                        for key, locations in sorted(extracted.items())
-                    ]
-                    if placeholders:
-                        Placeholder.objects.bulk_create(placeholders)
-
-                    handbook_file.parse_status = HandbookFile.ParseStatus.PARSED
-                    handbook_file.placeholder_total = len(placeholders)
-                    handbook_file.placeholder_resolved = 0
-                    handbook_file.save(
-                        update_fields=[
-                            "parse_status",
-                            "placeholder_total",
-                            "placeholder_resolved",
-                            "updated_at",
-                        ]
-                    )
-                except (BadZipFile, ValueError, RuntimeError) as exc:
-                    handbook_file.parse_status = HandbookFile.ParseStatus.FAILED
-                    handbook_file.parse_error = str(exc)
-                    handbook_file.save(update_fields=["parse_status", "parse_error", "updated_at"])
-            else:
-                handbook_file.parse_status = HandbookFile.ParseStatus.PARSED
-                handbook_file.save(update_fields=["parse_status", "updated_at"])
-
+            if parseable:
+                to_parse.append(handbook_file)
             files.append(handbook_file)
 
+    HandbookFile.objects.bulk_create(files, batch_size=500)
+    _parse_uploaded_files(to_parse)
+
     if files:
         handbook.status = Handbook.Status.IN_PROGRESS
         handbook.save(update_fields=["status", "updated_at"])
         autofill_placeholders_from_client(handbook=handbook)
-        refresh_handbook_completion(handbook=handbook)
+        # Completion is applied to these instances in place, so they need no re-fetch for the response.
+        refresh_handbook_completion(handbook=handbook, files=files)
 
-    files = list(HandbookFile.objects.filter(handbook=handbook).order_by("path_in_handbook"))
+    files.sort(key=lambda item: item.path_in_handbook)
     tree = build_handbook_tree(handbook=handbook)
     return UploadZipResult(tree=tree, files=files, warnings=warnings)
 
 
-def get_file_placeholders(*, handbook: Handbook, handbook_file: HandbookFile) -> dict[str, object]:
+def get_file_placeholders(
+    *,
+    handbook: Handbook,
+    handbook_file: HandbookFile,
+    asset_keys: frozenset[str] | None = None,
+) -> dict[str, object]:
     placeholders = list(
         Placeholder.objects.filter(handbook_file=handbook_file).order_by("key")
     )
@@ -1286,11 +1495,13 @@ def get_file_placeholders(*, handbook: Handbook, handbook_file: HandbookFile) ->
         .order_by("placeholder_id", "-created_at")
     ):
         latest_audits.setdefault(str(audit.placeholder_id), audit)
-    asset_keys = _resolved_asset_keys(handbook)
+    if asset_keys is None:
+        asset_keys = _resolved_asset_keys(handbook)
 
     payload: list[dict[str, object]] = []
     resolved_count = 0
     for item in placeholders:
+        placeholder_id = str(item.id)
         canonical_key = canonicalize_placeholder_key(item.key)
         value = value_map.get(canonical_key)
         value_text = value.value_text if value else None
@@ -1299,7 +1510,7 @@ def get_file_placeholders(*, handbook: Handbook, handbook_file: HandbookFile) ->
         if value and value.last_generation_audit_id and value.last_generation_audit and value.last_generation_audit.placeholder_id == item.id:
             latest_audit = value.last_generation_audit
         if latest_audit is None:
-            latest_audit = latest_audits.get(str(item.id))
+            latest_audit = latest_audits.get(placeholder_id)
 
         if item.kind == Placeholder.Kind.ASSET:
             resolved = canonical_key in asset_keys
@@ -1310,7 +1521,7 @@ def get_file_placeholders(*, handbook: Handbook, handbook_file: HandbookFile) ->
 
         payload.append(
             {
-                "id": str(item.id),
+                "id": placeholder_id,
                 "key": canonical_key,
                 "kind": item.kind,
                 "required": item.required,
@@ -1352,16 +1563,12 @@ def save_placeholder_values(
     values: list[dict[str, object]],
     source: str = PlaceholderValue.Source.MANUAL,
 ) -> dict[str, object]:
-    source_choices = {choice for choice, _label in PlaceholderValue.Source.choices}
     valid_placeholders = {
         canonicalize_placeholder_key(item.key): item
         for item in Placeholder.objects.filter(handbook_file=handbook_file)
     }
-    requested_audit_ids = {
-        str(entry.get("audit_id", "") or "").strip()
-        for entry in values
-        if str(entry.get("audit_id", "") or "").strip()
-    }
+    audit_ids = [str(entry.get("audit_id", "") or "").strip() for entry in values]
+    requested_audit_ids = {audit_id for audit_id in audit_ids if audit_id}
     audits_by_id = {
         str(item.id): item
         for item in PlaceholderGenerationAudit.objects.filter(
@@ -1369,8 +1576,9 @@ def save_placeholder_values(
             handbook=handbook,
         )
     }
+    pending: dict[str, PlaceholderValue] = {}
 
-    for entry in values:
+    for entry, audit_id_raw in zip(values, audit_ids):
         key = canonicalize_placeholder_key(str(entry.get("key", "")).strip())
         if not key:
             continue
@@ -1384,9 +1592,8 @@ def save_placeholder_values(
         value_text = None if value_text_raw is None else str(value_text_raw)
 
         asset_id_raw = entry.get("asset_id") or None
-        audit_id_raw = str(entry.get("audit_id", "") or "").strip()
         entry_source = str(entry.get("source", source)).strip().upper() or source
-        if entry_source not in source_choices:
+        if entry_source not in PLACEHOLDER_VALUE_SOURCES:
             raise HandbookServiceError(f"Unsupported placeholder source '{entry_source}'")
         audit = audits_by_id.get(audit_id_raw) if audit_id_raw else None
         if audit is not None and audit.placeholder_id != placeholder.id:
@@ -1402,13 +1609,18 @@ def save_placeholder_values(
         if placeholder.kind == Placeholder.Kind.ASSET:
             defaults["value_text"] = None
 
-        PlaceholderValue.objects.update_or_create(
-            handbook=handbook,
-            key=key,
-            defaults=defaults,
+        pending[key] = PlaceholderValue(handbook=handbook, key=key, **defaults)
+
+    if pending:
+        PlaceholderValue.objects.bulk_create(
+            pending.values(),
+            update_conflicts=True,
+            unique_fields=["handbook", "key"],
+            update_fields=["source", "value_text", "asset_id", "last_generation_audit", "updated_at"],
         )
 
-    resolved = _resolved_keys(handbook)
+    asset_keys = _resolved_asset_keys(handbook)
+    resolved = _resolved_text_keys(handbook) | asset_keys
     _update_file_completion(handbook, handbook_file, resolved_keys=resolved)
     _update_handbook_status(handbook, resolved_keys=resolved)
     completion_summary = get_handbook_completion_summary(handbook=handbook)
@@ -1416,7 +1628,7 @@ def save_placeholder_values(
     return {
         "snapshot": None,
         "handbook_completion": completion_summary,
-        **get_file_placeholders(handbook=handbook, handbook_file=handbook_file),
+        **get_file_placeholders(handbook=handbook, handbook_file=handbook_file, asset_keys=asset_keys),
     }
 
 
@@ -1534,6 +1746,7 @@ def _validate_export_completion(handbook: Handbook) -> None:
     for item in (
         Placeholder.objects.filter(handbook_file__handbook=handbook, required=True)
         .select_related("handbook_file")
+        .only("handbook_file__path_in_handbook", "key", "kind")
         .order_by("handbook_file__path_in_handbook", "key")
     ):
         key = canonicalize_placeholder_key(item.key)
@@ -1568,6 +1781,99 @@ def _text_values_by_key(handbook: Handbook) -> dict[str, str]:
     return values
 
 
+def _write_file_to_archive(
+    archive: ZipFile,
+    path: Path,
+    arcname: str,
+    *,
+    compress_type: int = ZIP_DEFLATED,
+) -> None:
+    info = ZipInfo.from_file(path, arcname)
+    info.compress_type = compress_type
+    with path.open("rb") as source, archive.open(info, "w") as target:
+        shutil.copyfileobj(source, target, COPY_BUFFER_SIZE)
+
+
+def _asset_fingerprint(assets: dict[str, ResolvedOfficeAsset | None]) -> str:
+    parts = []
+    for key in sorted(assets):
+        asset = assets[key]
+        if asset is None:
+            parts.append(f"{key}:")
+        else:
+            digest = asset.ref.sha256 or hashlib.sha256(asset.payload).hexdigest()
+            parts.append(f"{key}:{digest}:{asset.width}x{asset.height}")
+    return "|".join(parts)
+
+
+def _export_cache_key(
+    item: HandbookFile,
+    *,
+    placeholder_keys: list[str],
+    text_values: dict[str, str],
+    asset_fingerprint: str,
+) -> str:
+    """Content address of a rendered export file; empty when the source checksum is unknown."""
+    if not item.checksum:
+        return ""
+    keys = sorted({canonicalize_placeholder_key(key) for key in placeholder_keys})
+    payload = json.dumps(
+        {
+            "version": EXPORT_CACHE_VERSION,
+            "checksum": item.checksum,
+            "values": {key: text_values.get(key) for key in keys},
+            "assets": asset_fingerprint,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _prepare_export_target(item: HandbookFile, output_root: Path) -> tuple[Path, Path, str]:
+    source = Path(item.original_blob_ref)
+    if not source.exists():
+        raise HandbookServiceError(f"Source file not found: {item.path_in_handbook}")
+
+    target = (output_root / item.path_in_handbook).resolve()
+    if output_root not in target.parents and target != output_root:
+        raise HandbookServiceError(f"Invalid output path: {item.path_in_handbook}")
+
+    target.parent.mkdir(parents=True, exist_ok=True)
+    return source, target, str(target.relative_to(output_root))
+
+
+@dataclass
+class _ExportRenderContext:
+    text_values: dict[str, str]
+    assets: dict[str, ResolvedOfficeAsset | None]
+    resolved: dict[str, str] = field(default_factory=dict)
+    resolved_bytes: dict[bytes, bytes] = field(default_factory=dict)
+
+
+def _render_export_batch(
+    sources: list[Path],
+    text_values: dict[str, str],
+    assets: dict[str, ResolvedOfficeAsset | None],
+) -> list[bytes]:
+    # Runs in a pooled worker; the memo lives for one batch so pooled workers keep no handbook data.
+    context = _ExportRenderContext(text_values=text_values, assets=assets)
+    return [_render_export_payload(context, source) for source in sources]
+
+
+def _render_export_payload(context: _ExportRenderContext, source: Path) -> bytes:
+    # File and CPU work only, no ORM access.
+    ext = source.suffix.lower()
+    payload = replace_text_placeholders_in_ooxml_bytes(
+        source.read_bytes(),
+        ext,
+        context.text_values,
+        resolved=context.resolved,
+        resolved_bytes=context.resolved_bytes,
+    )
+    return _inject_assets(ext, payload, context.assets)
+
+
 @transaction.atomic
 def export_handbook(*, handbook: Handbook) -> tuple[Path, VersionSnapshot]:
     _validate_export_completion(handbook)
@@ -1585,46 +1891,106 @@ def export_handbook(*, handbook: Handbook) -> tuple[Path, VersionSnapshot]:
     text_values = _text_values_by_key(handbook)
     assets = _load_assets_for_injection(handbook)
 
-    for item in files:
-        source = Path(item.original_blob_ref)
-        if not source.exists():
-            raise HandbookServiceError(f"Source file not found: {item.path_in_handbook}")
-
-        target = (output_root / item.path_in_handbook).resolve()
-        output_root_resolved = output_root.resolve()
-        if output_root_resolved not in target.parents and target != output_root_resolved:
-            raise HandbookServiceError(f"Invalid output path: {item.path_in_handbook}")
-
-        target.parent.mkdir(parents=True, exist_ok=True)
-        ext = source.suffix.lower()
-
-        if ext not in PARSEABLE_EXTS:
-            shutil.copy2(source, target)
-            item.working_blob_ref = str(target)
-            item.save(update_fields=["working_blob_ref", "updated_at"])
-            continue
-
-        payload = source.read_bytes()
-        payload = replace_text_placeholders_in_ooxml_bytes(payload, ext, text_values)
-        payload = _inject_assets(ext, payload, assets)
-        target.write_bytes(payload)
-
-        item.working_blob_ref = str(target)
-        item.save(update_fields=["working_blob_ref", "updated_at"])
-
     exports_dir = root / "exports"
     exports_dir.mkdir(parents=True, exist_ok=True)
 
     latest = handbook.snapshots.order_by("-version_number").first()
     version_hint = (latest.version_number if latest else 0) + 1
     zip_path = exports_dir / f"handbook-{handbook.id}-v{version_hint}.zip"
+    output_root_resolved = output_root.resolve()
 
-    with ZipFile(zip_path, "w", compression=ZIP_DEFLATED) as archive:
-        for file_path in sorted(output_root.rglob("*")):
-            if file_path.is_dir():
-                continue
-            arcname = str(file_path.relative_to(output_root))
-            archive.write(file_path, arcname)
+    cache_dir = root / "render-cache"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    keys_by_file: defaultdict[object, list[str]] = defaultdict(list)
+    for file_id, key in Placeholder.objects.filter(handbook_file__handbook=handbook).values_list(
+        "handbook_file_id", "key"
+    ):
+        keys_by_file[file_id].append(key)
+    asset_fingerprint = _asset_fingerprint(assets)
+
+    targets: list[tuple[HandbookFile, Path, Path, str, Path | None, bool]] = []
+    render_sources: list[Path] = []
+    queued: set[Path] = set()
+    for item in files:
+        source, target, arcname = _prepare_export_target(item, output_root_resolved)
+        cached: Path | None = None
+        render = False
+        if source.suffix.lower() in PARSEABLE_EXTS:
+            cache_key = _export_cache_key(
+                item,
+                placeholder_keys=keys_by_file.get(item.id, []),
+                text_values=text_values,
+                asset_fingerprint=asset_fingerprint,
+            )
+            cached = cache_dir / f"{cache_key}{source.suffix.lower()}" if cache_key else None
+            # Files sharing a cache key render once; later copies read the entry the first one writes.
+            if cached is None or (cached not in queued and not cached.exists()):
+                render = True
+                render_sources.append(source)
+                if cached is not None:
+                    queued.add(cached)
+        targets.append((item, source, target, arcname, cached, render))
+
+    exported_at = timezone.now()
+
+    context = _ExportRenderContext(text_values=text_values, assets=assets)
+    try:
+        with ExitStack() as stack:
+            if should_use_worker_pool(len(render_sources)):
+                # Contiguous batches keep payloads in target order and amortize shipping the values.
+                batch_size = -(-len(render_sources) // worker_pool_size())
+                batches = [
+                    render_sources[start : start + batch_size]
+                    for start in range(0, len(render_sources), batch_size)
+                ]
+                payloads = chain.from_iterable(
+                    get_worker_pool().map(
+                        _render_export_batch,
+                        batches,
+                        repeat(text_values),
+                        repeat(assets),
+                    )
+                )
+            else:
+                payloads = map(partial(_render_export_payload, context), render_sources)
+            archive = stack.enter_context(ZipFile(zip_path, "w", compression=ZIP_DEFLATED))
+            storage = LocalFilesystemStorage(root=root)
+
+            for item, source, target, arcname, cached, render in targets:
+                if source.suffix.lower() not in PARSEABLE_EXTS:
+                    storage.copy(source, target)
+                    _write_file_to_archive(archive, target, arcname)
+                elif not render:
+                    try:
+                        storage.copy(cached, target)
+                    except StorageReadError:
+                        # The entry vanished after planning (e.g. a concurrent export pruned it).
+                        payload = _render_export_payload(context, source)
+                        target.write_bytes(payload)
+                        cached.write_bytes(payload)
+                    _write_file_to_archive(archive, target, arcname, compress_type=ZIP_STORED)
+                else:
+                    # OOXML packages are already deflated; compressing them again only burns CPU.
+                    payload = next(payloads)
+                    target.write_bytes(payload)
+                    archive.writestr(arcname, payload, compress_type=ZIP_STORED)
+                    if cached is not None:
+                        cached.write_bytes(payload)
+
+                item.working_blob_ref = str(target)
+                item.updated_at = exported_at
+    except BaseException as exc:
+        zip_path.unlink(missing_ok=True)
+        if isinstance(exc, BrokenProcessPool):
+            reset_worker_pool()
+        raise
+
+    HandbookFile.objects.bulk_update(files, ["working_blob_ref", "updated_at"])
+
+    used = {cached.name for *_rest, cached, _render in targets if cached is not None}
+    for entry in cache_dir.iterdir():
+        if entry.name not in used:
+            entry.unlink(missing_ok=True)
 
     completion_summary, completion_hash = _build_completion_state(handbook)
     handbook.status = Handbook.Status.EXPORTED
@@ -189,6 +189,10 @@ def inject_docx_assets(
                     height_in,
                 )
 
+    if not occurrences:
+        # No asset placeholders: skip re-serializing an unchanged package.
+        return payload, errors, occurrences
+
     out = BytesIO()
     doc.save(out)
     return out.getvalue(), errors, occurrences
@@ -69,6 +69,9 @@ def inject_pptx_assets(
                 continue
             shape.text = updated.strip()
 
+    if not occurrences:
+        return payload, errors, occurrences
+
     out = BytesIO()
     presentation.save(out)
     return out.getvalue(), errors, occurrences
@@ -69,6 +69,9 @@ def inject_xlsx_assets(
                     continue
                 cell.value = updated.strip() or None
 
+    if not occurrences:
+        return payload, errors, occurrences
+
     out = BytesIO()
     workbook.save(out)
     return out.getvalue(), errors, occurrences
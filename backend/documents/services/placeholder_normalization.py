@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+from functools import lru_cache
 import re
 
 from .variable_keys import CANONICAL_ASSET_LOGO, CANONICAL_ASSET_SIGNATURE
 
 
+SEGMENT_SPLIT_PATTERN = re.compile(r"[|,]")
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
 CURRENT_DATE_KEYS = {
     "date",
     "validity_date",
@@ -43,16 +47,17 @@ def extract_placeholder_segments(raw: str) -> list[str]:
     if token.startswith("__ASSET_") or token.startswith("["):
         token = token.split(":", 1)[0].strip()
 
-    parts = [part.strip() for part in re.split(r"[|,]", token) if part.strip()]
+    parts = [part.strip() for part in SEGMENT_SPLIT_PATTERN.split(token) if part.strip()]
     return parts
 
 
+@lru_cache(maxsize=4096)
 def canonicalize_placeholder_key(raw: str) -> str:
     segments = extract_placeholder_segments(raw)
     if not segments:
         return ""
 
-    lowered = re.sub(r"\s+", "", segments[0]).lower()
+    lowered = WHITESPACE_PATTERN.sub("", segments[0]).lower()
     if not lowered:
         return ""
 
@@ -60,17 +65,17 @@ def canonicalize_placeholder_key(raw: str) -> str:
 
 
 def placeholder_has_modifier(raw: str, modifier: str) -> bool:
-    normalized_modifier = re.sub(r"\s+", "", (modifier or "")).lower()
+    normalized_modifier = WHITESPACE_PATTERN.sub("", modifier or "").lower()
     if not normalized_modifier:
         return False
     return any(
-        re.sub(r"\s+", "", part).lower() == normalized_modifier
+        WHITESPACE_PATTERN.sub("", part).lower() == normalized_modifier
         for part in extract_placeholder_segments(raw)[1:]
     )
 
 
 def is_current_date_placeholder(*, raw: str | None = None, canonical_key: str | None = None) -> bool:
-    key = canonicalize_placeholder_key(raw or "") if raw else re.sub(r"\s+", "", canonical_key or "").lower()
+    key = canonicalize_placeholder_key(raw or "") if raw else WHITESPACE_PATTERN.sub("", canonical_key or "").lower()
     if not key:
         return False
 
@@ -2,18 +2,31 @@ from __future__ import annotations
 
 from collections import Counter
 from dataclasses import asdict, dataclass
+from datetime import date, datetime, time
 from io import BytesIO
 import math
 import re
-from typing import Protocol
+from typing import Iterable, Iterator, Protocol
 
 from docx import Document as DocxDocument
+from docx.oxml.ns import qn
 from openpyxl import load_workbook
 from pypdf import PdfReader
 from pptx import Presentation  # type: ignore
 
 from .token_metrics import estimate_token_count
 
+try:
+    import pymupdf  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    pymupdf = None
+
+try:
+    from python_calamine import CalamineError, CalamineWorkbook  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    CalamineError = None
+    CalamineWorkbook = None
+
 
 @dataclass(frozen=True)
 class NormalizedSection:
@@ -63,8 +76,16 @@ SUPPORTED_REFERENCE_EXTENSIONS = {
     ".pdf": "PDF",
 }
 
+# Bump when extraction output changes so cached normalized documents are not reused.
+EXTRACTOR_VERSION = 2
 MAX_SECTION_CHARS = 1800
 SUMMARY_MAX_CHARS = 600
+# Excel switches to exponent notation from 1E+15, which openpyxl then reads back as float.
+CALAMINE_INT_LIMIT = 10**15
+PARAGRAPH_BREAK_PATTERN = re.compile(r"\n\s*\n+")
+MARKDOWN_HEADING_PATTERN = re.compile(r"^(#{1,6})\s+(.*)$")
+TERM_PATTERN = re.compile(r"[A-Za-zÄÖÜäöüß][A-Za-zÄÖÜäöüß0-9_-]{2,}")
+LIST_ITEM_PATTERN = re.compile(r"(^|\n)\s*(?:[-*•]|\d+[.)])\s+")
 STOPWORDS = {
     "und",
     "oder",
@@ -121,10 +142,26 @@ def infer_reference_file_type(filename: str) -> str:
     return SUPPORTED_REFERENCE_EXTENSIONS.get(ext, "OTHER")
 
 
+def _serialize_section(section: NormalizedSection) -> dict[str, object]:
+    # Sections are flat JSON-shaped records; asdict() would recurse and deep-copy every field.
+    return {
+        "id": section.id,
+        "type": section.type,
+        "title": section.title,
+        "locator": dict(section.locator),
+        "content": section.content,
+        "estimated_tokens": section.estimated_tokens,
+        "section_kind": section.section_kind,
+        "keywords": list(section.keywords),
+        "themes": list(section.themes),
+        "signals": dict(section.signals),
+    }
+
+
 def serialize_normalized_document(document: NormalizedDocument) -> dict[str, object]:
     return {
         "document_summary": document.document_summary,
-        "sections": [asdict(item) for item in document.sections],
+        "sections": [_serialize_section(item) for item in document.sections],
         "analysis": asdict(document.analysis),
     }
 
@@ -208,6 +245,20 @@ def deserialize_normalized_document(payload: dict[str, object]) -> NormalizedDoc
     )
 
 
+def _docx_table_rows(table) -> list[str]:
+    # Walk the already-parsed table XML directly; python-docx cell proxies rebuild the grid on every access.
+    rows: list[str] = []
+    for row in table.tr_lst:
+        row_values: list[str] = []
+        for cell in row.tc_lst:
+            text = "\n".join(paragraph.text for paragraph in cell.p_lst).strip()
+            if text:
+                row_values.append(text)
+        if row_values:
+            rows.append(" | ".join(row_values))
+    return rows
+
+
 class DocxReferenceExtractor:
     def extract(self, payload: bytes) -> NormalizedDocument:
         document = DocxDocument(BytesIO(payload))
@@ -242,14 +293,8 @@ class DocxReferenceExtractor:
         if current_lines:
             flush({"paragraph": para_index})
 
-        table_index = 0
-        for table in document.tables:
-            table_index += 1
-            rows: list[str] = []
-            for row in table.rows:
-                row_values = [cell.text.strip() for cell in row.cells if (cell.text or "").strip()]
-                if row_values:
-                    rows.append(" | ".join(row_values))
+        for table_index, table in enumerate(document.element.body.iterchildren(qn("w:tbl")), start=1):
+            rows = _docx_table_rows(table)
             if rows:
                 groups.append((f"Tabelle {table_index}", rows, {"table": table_index}))
 
@@ -282,11 +327,15 @@ class PptxReferenceExtractor:
 
 class XlsxReferenceExtractor:
     def extract(self, payload: bytes) -> NormalizedDocument:
-        workbook = load_workbook(BytesIO(payload), data_only=True, read_only=True)
+        try:
+            sheets = _xlsx_sheet_rows(payload)
+        except Exception as exc:  # noqa: BLE001
+            raise ReferenceExtractionError(f"XLSX extraction failed: {exc}") from exc
+
         groups: list[tuple[str, list[str], dict[str, object]]] = []
-        for sheet in workbook.worksheets:
+        for sheet_title, rows in sheets:
             row_lines: list[tuple[int, str]] = []
-            for row_idx, row in enumerate(sheet.iter_rows(values_only=True), start=1):
+            for row_idx, row in enumerate(rows, start=1):
                 values = [str(cell).strip() for cell in row if cell is not None and str(cell).strip()]
                 if values:
                     row_lines.append((row_idx, " | ".join(values)))
@@ -300,9 +349,9 @@ class XlsxReferenceExtractor:
                 if chunk and current_len + extra_len > MAX_SECTION_CHARS:
                     groups.append(
                         (
-                            f"{sheet.title} ({chunk_start}-{row_idx - 1})",
+                            f"{sheet_title} ({chunk_start}-{row_idx - 1})",
                             chunk,
-                            {"sheet": sheet.title, "row_start": chunk_start, "row_end": row_idx - 1},
+                            {"sheet": sheet_title, "row_start": chunk_start, "row_end": row_idx - 1},
                         )
                     )
                     chunk = []
@@ -313,14 +362,52 @@ class XlsxReferenceExtractor:
             if chunk:
                 groups.append(
                     (
-                        f"{sheet.title} ({chunk_start}-{row_lines[-1][0]})",
+                        f"{sheet_title} ({chunk_start}-{row_lines[-1][0]})",
                         chunk,
-                        {"sheet": sheet.title, "row_start": chunk_start, "row_end": row_lines[-1][0]},
+                        {"sheet": sheet_title, "row_start": chunk_start, "row_end": row_lines[-1][0]},
                     )
                 )
         return _build_document_from_groups(groups, default_title="XLSX Referenz")
 
 
+def _xlsx_sheet_rows(payload: bytes) -> Iterable[tuple[str, Iterable[Iterable[object]]]]:
+    # The Rust-backed calamine reader is much faster than openpyxl; openpyxl remains the fallback.
+    if CalamineWorkbook is not None:
+        try:
+            workbook = CalamineWorkbook.from_filelike(BytesIO(payload))
+            return [
+                (name, _calamine_rows(workbook.get_sheet_by_name(name).to_python(skip_empty_area=False)))
+                for name in workbook.sheet_names
+            ]
+        except CalamineError:
+            pass
+    return _openpyxl_sheet_rows(load_workbook(BytesIO(payload), data_only=True, read_only=True))
+
+
+def _calamine_rows(rows: list[list[object]]) -> Iterator[list[object]]:
+    for row in rows:
+        yield [_calamine_cell(cell) for cell in row]
+
+
+def _calamine_cell(cell: object) -> object:
+    # Match openpyxl's values so section text does not depend on the installed reader:
+    # openpyxl reads numbers Excel stores without a fraction or exponent as int, and
+    # date-only cells as midnight datetimes.
+    if isinstance(cell, float):
+        return int(cell) if cell.is_integer() and abs(cell) < CALAMINE_INT_LIMIT else cell
+    if isinstance(cell, date) and not isinstance(cell, datetime):
+        return datetime.combine(cell, time())
+    return cell
+
+
+def _openpyxl_sheet_rows(workbook) -> Iterator[tuple[str, Iterator[tuple[object, ...]]]]:
+    try:
+        for sheet in workbook.worksheets:
+            yield sheet.title, sheet.iter_rows(values_only=True)
+    finally:
+        workbook.close()
+
+
 class TextReferenceExtractor:
     def __init__(self, *, markdown: bool = False) -> None:
         self.markdown = markdown
@@ -336,22 +423,49 @@ class TextReferenceExtractor:
 class PdfReferenceExtractor:
     def extract(self, payload: bytes) -> NormalizedDocument:
         try:
-            reader = PdfReader(BytesIO(payload))
+            pages = _pdf_page_texts(payload)
         except Exception as exc:  # noqa: BLE001
             raise ReferenceExtractionError(f"PDF extraction failed: {exc}") from exc
 
         groups: list[tuple[str, list[str], dict[str, object]]] = []
-        for page_index, page in enumerate(reader.pages, start=1):
-            page_text = (page.extract_text() or "").strip()
+        for page_index, page_text in enumerate(pages, start=1):
             if not page_text:
                 continue
-            paragraphs = [item.strip() for item in re.split(r"\n\s*\n+", page_text) if item.strip()]
+            paragraphs = [stripped for item in PARAGRAPH_BREAK_PATTERN.split(page_text) if (stripped := item.strip())]
             groups.append((f"Seite {page_index}", paragraphs or [page_text], {"page": page_index}))
         if not groups:
             raise ReferenceExtractionError("PDF contains no extractable text")
         return _build_document_from_groups(groups, default_title="PDF Referenz")
 
 
+def _pdf_page_texts(payload: bytes) -> list[str]:
+    # PyMuPDF (AGPL, not a declared dependency) is used when a deployment installs it; pypdf is the
+    # baseline reader and also takes over whenever PyMuPDF rejects a file.
+    if pymupdf is not None:
+        try:
+            return _pymupdf_page_texts(payload)
+        except (RuntimeError, ValueError):
+            pass
+    return _pypdf_page_texts(payload)
+
+
+def _pymupdf_page_texts(payload: bytes) -> list[str]:
+    with pymupdf.open(stream=payload, filetype="pdf") as document:
+        return [(page.get_text("text") or "").strip() for page in document]
+
+
+def _pypdf_page_texts(payload: bytes) -> list[str]:
+    reader = PdfReader(BytesIO(payload))
+    return [(page.extract_text() or "").strip() for page in reader.pages]
+
+
+def extractor_version(file_type: str) -> str:
+    # PyMuPDF and pypdf lay out page text differently, so the PDF reader is part of the version.
+    if file_type == "PDF" and pymupdf is not None:
+        return f"{EXTRACTOR_VERSION}+pymupdf"
+    return str(EXTRACTOR_VERSION)
+
+
 def get_reference_extractor(file_type: str) -> ReferenceExtractor:
     if file_type == "DOCX":
         return DocxReferenceExtractor()
@@ -377,7 +491,7 @@ def _extract_markdown_groups(text: str) -> list[tuple[str, list[str], dict[str,
     groups: list[tuple[str, list[str], dict[str, object]]] = []
     current_title = "Dokument"
     current_lines: list[str] = []
-    heading_re = re.compile(r"^(#{1,6})\s+(.*)$")
+    lines = text.splitlines()
 
     def flush(line_no: int) -> None:
         nonlocal current_lines
@@ -386,9 +500,9 @@ def _extract_markdown_groups(text: str) -> list[tuple[str, list[str], dict[str,
             groups.append((current_title, [content], {"line": line_no}))
         current_lines = []
 
-    for line_no, raw_line in enumerate(text.splitlines(), start=1):
+    for line_no, raw_line in enumerate(lines, start=1):
         line = raw_line.rstrip()
-        match = heading_re.match(line)
+        match = MARKDOWN_HEADING_PATTERN.match(line)
         if match:
             flush(line_no - 1)
             current_title = match.group(2).strip() or current_title
@@ -397,17 +511,18 @@ def _extract_markdown_groups(text: str) -> list[tuple[str, list[str], dict[str,
             current_lines.append(line.strip())
         elif current_lines:
             current_lines.append("")
-    flush(len(text.splitlines()))
+    flush(len(lines))
     return groups
 
 
 def _extract_plaintext_groups(text: str) -> list[tuple[str, list[str], dict[str, object]]]:
     groups: list[tuple[str, list[str], dict[str, object]]] = []
-    for index, chunk in enumerate(re.split(r"\n\s*\n+", text), start=1):
+    for index, chunk in enumerate(PARAGRAPH_BREAK_PATTERN.split(text), start=1):
         cleaned = chunk.strip()
         if not cleaned:
             continue
-        title = cleaned.splitlines()[0][:120]
+        # Only the first 120 characters can contribute to the title, so avoid splitting the whole paragraph.
+        title = cleaned[:121].splitlines()[0][:120]
         groups.append((title or f"Abschnitt {index}", [cleaned], {"group": index}))
     return groups
 
@@ -433,17 +548,18 @@ def _build_document_from_groups(
                 content = "\n".join(buffer).strip()
                 if content:
                     title = group_title if part == 1 else f"{group_title} ({part})"
+                    section_locator = {**locator, "part": part}
                     section_kind, keywords, themes, signals = _analyze_section(
                         title=title,
                         content=content,
-                        locator={**locator, "part": part},
+                        locator=section_locator,
                     )
                     sections.append(
                         NormalizedSection(
                             id=f"section-{ordinal}",
                             type="section",
                             title=title,
-                            locator={**locator, "part": part},
+                            locator=section_locator,
                             content=content,
                             estimated_tokens=estimate_token_count(content),
                             section_kind=section_kind,
@@ -463,17 +579,18 @@ def _build_document_from_groups(
             title = group_title or default_title
             if part > 1:
                 title = f"{title} ({part})"
+            section_locator = {**locator, "part": part}
             section_kind, keywords, themes, signals = _analyze_section(
                 title=title,
                 content=content,
-                locator={**locator, "part": part},
+                locator=section_locator,
             )
             sections.append(
                 NormalizedSection(
                     id=f"section-{ordinal}",
                     type="section",
                     title=title,
-                    locator={**locator, "part": part},
+                    locator=section_locator,
                     content=content,
                     estimated_tokens=estimate_token_count(content),
                     section_kind=section_kind,
@@ -506,16 +623,15 @@ def _build_document_from_groups(
     return NormalizedDocument(document_summary=summary, sections=sections, analysis=analysis)
 
 
-def _tokenize_terms(text: str) -> list[str]:
-    return [
-        term
-        for term in re.findall(r"[A-Za-zÄÖÜäöüß][A-Za-zÄÖÜäöüß0-9_-]{2,}", text.lower())
-        if term not in STOPWORDS
-    ]
+def _iter_terms(text: str) -> Iterator[str]:
+    for match in TERM_PATTERN.finditer(text.lower()):
+        term = match.group()
+        if term not in STOPWORDS:
+            yield term
 
 
 def _extract_keywords(text: str, *, limit: int = 10) -> list[str]:
-    counter = Counter(_tokenize_terms(text))
+    counter = Counter(_iter_terms(text))
     return [term for term, _count in counter.most_common(limit)]
 
 
@@ -552,7 +668,7 @@ def _analyze_section(
         section_kind = "table"
     elif "sheet" in locator:
         section_kind = "table"
-    elif re.search(r"(^|\n)\s*(?:[-*•]|\d+[.)])\s+", content):
+    elif LIST_ITEM_PATTERN.search(content):
         section_kind = "bullet_list"
     elif themes and themes[0] in {"workflow", "instruction"}:
         section_kind = "procedure"
@@ -7,7 +7,9 @@ from pathlib import Path
 
 from django.conf import settings
 from django.db import transaction
+from django.db.models import Prefetch
 
+from common.hashing import sha256_text
 from documents.models import (
     DocumentTextExtractionCache,
     Handbook,
@@ -18,11 +20,12 @@ from documents.models import (
     ReferenceDocumentLink,
 )
 
-from .common import handbook_root, sanitize_relative_path
+from .common import handbook_root, link_uploaded_file, sanitize_relative_path
 from .reference_extraction import (
     ReferenceExtractionError,
     deserialize_normalized_document,
     extract_reference_document,
+    extractor_version,
     infer_reference_file_type,
     serialize_normalized_document,
 )
@@ -32,6 +35,20 @@ class ReferenceServiceError(ValueError):
     pass
 
 
+def _links_prefetch() -> Prefetch:
+    return Prefetch(
+        "links",
+        queryset=ReferenceDocumentLink.objects.only(
+            "id",
+            "reference_document_id",
+            "scope",
+            "handbook_file_id",
+            "placeholder_id",
+            "created_at",
+        ).order_by("created_at"),
+    )
+
+
 def _reference_dirs(handbook: Handbook) -> tuple[Path, Path]:
     root = Path(handbook.root_storage_path or handbook_root(str(handbook.id)))
     originals = root / "reference-files" / "originals"
@@ -61,21 +78,29 @@ def upload_reference_document(*, handbook: Handbook, uploaded) -> ReferenceDocum
     storage_path = (originals_dir / filename).resolve()
     storage_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with storage_path.open("wb") as handle:
-        if hasattr(uploaded, "chunks"):
-            for chunk in uploaded.chunks():
-                size_bytes += len(chunk)
+    if hasattr(uploaded, "temporary_file_path") and int(getattr(uploaded, "size", 0)) > max_size:
+        raise ReferenceServiceError("Reference file exceeds configured size limit")
+
+    if link_uploaded_file(uploaded, storage_path):
+        with storage_path.open("rb") as handle:
+            checksum = hashlib.file_digest(handle, "sha256")
+        size_bytes = storage_path.stat().st_size
+    else:
+        with storage_path.open("wb") as handle:
+            if hasattr(uploaded, "chunks"):
+                for chunk in uploaded.chunks():
+                    size_bytes += len(chunk)
+                    if size_bytes > max_size:
+                        raise ReferenceServiceError("Reference file exceeds configured size limit")
+                    checksum.update(chunk)
+                    handle.write(chunk)
+            else:
+                payload = uploaded.read()
+                size_bytes = len(payload)
                 if size_bytes > max_size:
                     raise ReferenceServiceError("Reference file exceeds configured size limit")
-                checksum.update(chunk)
-                handle.write(chunk)
-        else:
-            payload = uploaded.read()
-            size_bytes = len(payload)
-            if size_bytes > max_size:
-                raise ReferenceServiceError("Reference file exceeds configured size limit")
-            checksum.update(payload)
-            handle.write(payload)
+                checksum.update(payload)
+                handle.write(payload)
 
     mime_type = getattr(uploaded, "content_type", "") or (mimetypes.guess_type(filename)[0] or "application/octet-stream")
     file_type = infer_reference_file_type(filename)
@@ -180,13 +205,17 @@ def delete_reference_link(*, handbook: Handbook, reference_document_id: str, lin
 def list_reference_documents(*, handbook: Handbook) -> list[ReferenceDocument]:
     return list(
         ReferenceDocument.objects.filter(handbook=handbook)
-        .prefetch_related("links")
+        .prefetch_related(_links_prefetch())
         .order_by("-created_at")
     )
 
 
 def get_reference_document_preview(*, handbook: Handbook, reference_document_id: str, limit: int = 8) -> dict[str, object]:
-    reference_document = ReferenceDocument.objects.filter(id=reference_document_id, handbook=handbook).first()
+    reference_document = (
+        ReferenceDocument.objects.filter(id=reference_document_id, handbook=handbook)
+        .prefetch_related(_links_prefetch())
+        .first()
+    )
     if reference_document is None:
         raise ReferenceServiceError("Reference document not found")
 
@@ -218,7 +247,7 @@ def get_reference_document_preview(*, handbook: Handbook, reference_document_id:
             "low_signal": normalized.analysis.low_signal,
         },
         "sections": preview_sections,
-        "links": [_serialize_reference_link(link) for link in reference_document.links.all().order_by("created_at")],
+        "links": [_serialize_reference_link(link) for link in reference_document.links.all()],
     }
 
 
@@ -246,14 +275,13 @@ def _populate_reference_document(*, reference_document: ReferenceDocument) -> No
     if not source_path.exists():
         raise ReferenceServiceError("Reference document file is missing")
 
-    payload = source_path.read_bytes()
     normalized_path = _normalized_path_for(reference_document)
 
     try:
         normalized = _get_or_extract_cached(
             checksum=reference_document.checksum,
             file_type=reference_document.file_type,
-            payload=payload,
+            source_path=source_path,
         )
     except ReferenceExtractionError as exc:
         message = str(exc)
@@ -294,11 +322,12 @@ def _populate_reference_document(*, reference_document: ReferenceDocument) -> No
                 title=section.title,
                 locator=section.locator,
                 content=section.content,
-                content_hash=hashlib.sha256(section.content.encode("utf-8")).hexdigest(),
+                content_hash=sha256_text(section.content),
                 estimated_tokens=section.estimated_tokens,
             )
             for index, section in enumerate(normalized.sections, start=1)
-        ]
+        ],
+        batch_size=1000,
     )
 
     reference_document.parse_status = ReferenceDocument.ParseStatus.PARSED
@@ -318,15 +347,21 @@ def _populate_reference_document(*, reference_document: ReferenceDocument) -> No
     )
 
 
-def _get_or_extract_cached(*, checksum: str, file_type: str, payload: bytes):
-    cache_entry = DocumentTextExtractionCache.objects.filter(checksum=checksum, file_type=file_type).first()
+def _get_or_extract_cached(*, checksum: str, file_type: str, source_path: Path):
+    version = extractor_version(file_type)
+    cache_entry = DocumentTextExtractionCache.objects.filter(
+        checksum=checksum,
+        file_type=file_type,
+        extractor_version=version,
+    ).first()
     if cache_entry and isinstance(cache_entry.normalized_data, dict) and cache_entry.normalized_data:
         return deserialize_normalized_document(cache_entry.normalized_data)
 
-    normalized = extract_reference_document(payload=payload, file_type=file_type)
+    normalized = extract_reference_document(payload=source_path.read_bytes(), file_type=file_type)
     DocumentTextExtractionCache.objects.update_or_create(
         checksum=checksum,
         file_type=file_type,
+        extractor_version=version,
         defaults={"normalized_data": serialize_normalized_document(normalized)},
     )
     return normalized
@@ -348,7 +383,7 @@ def get_handbook_file_text_context(handbook_file: HandbookFile):
         return _get_or_extract_cached(
             checksum=handbook_file.checksum,
             file_type=reference_type,
-            payload=source_path.read_bytes(),
+            source_path=source_path,
         )
     except ReferenceExtractionError:
         return None
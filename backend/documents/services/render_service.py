@@ -208,7 +208,7 @@ def render_document(
         version_number=version,
         file_path=str(output_path),
         mime_type=document.mime_type,
-        size_bytes=output_path.stat().st_size,
+        size_bytes=len(output_bytes),
         created_by=DocumentVersion.CreatedBy.SYSTEM,
         metadata={
             "operation": "render",
@@ -96,7 +96,7 @@ def rewrite_document(
         version_number=next_version,
         file_path=str(output_path),
         mime_type="text/markdown",
-        size_bytes=output_path.stat().st_size,
+        size_bytes=len(payload),
         created_by=DocumentVersion.CreatedBy.AI,
         ai_prompt=clean_instruction,
         ai_model=response.model,
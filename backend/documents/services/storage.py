@@ -2,7 +2,9 @@ from __future__ import annotations
 
 from collections.abc import Iterator
 from contextlib import contextmanager
+import os
 from pathlib import Path
+import shutil
 from typing import Protocol
 
 from django.conf import settings
@@ -23,6 +25,8 @@ class StorageProvider(Protocol):
 
     def exists(self, path: str) -> bool: ...
 
+    def copy(self, source: str | Path, destination: str | Path) -> None: ...
+
 
 class LocalFilesystemStorage:
     def __init__(self, root: Path | None = None) -> None:
@@ -60,9 +64,14 @@ class LocalFilesystemStorage:
             return [str(base)]
 
         files: list[str] = []
-        for item in base.rglob("*"):
-            if item.is_file():
-                files.append(str(item))
+        pending = [str(base)]
+        while pending:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.is_file():
+                        files.append(entry.path)
         files.sort()
         return files
 
@@ -83,6 +92,19 @@ class LocalFilesystemStorage:
     def exists(self, path: str) -> bool:
         return self._resolve(path).exists()
 
+    def copy(self, source: str | Path, destination: str | Path) -> None:
+        """Place ``source`` at ``destination`` as a hardlink, falling back to a kernel-side copy."""
+        source_path = self._resolve(source)
+        target = self._resolve(destination)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.unlink(missing_ok=True)
+        try:
+            os.link(source_path, target)
+        except FileNotFoundError as exc:
+            raise StorageReadError(f"Storage file not found: {source_path}") from exc
+        except OSError:
+            shutil.copyfile(source_path, target)
+
     @contextmanager
     def open_read_stream(self, path: str | Path) -> Iterator[object]:
         target = self._resolve(path)
@@ -127,6 +149,10 @@ class S3Storage:
         del path
         raise NotImplementedError("S3Storage is not enabled")
 
+    def copy(self, source: str | Path, destination: str | Path) -> None:  # pragma: no cover - stub
+        del source, destination
+        raise NotImplementedError("S3Storage is not enabled")
+
 
 # Backward-compatible alias used by the existing document pipeline.
 LocalStorage = LocalFilesystemStorage
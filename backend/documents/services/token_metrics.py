@@ -36,7 +36,7 @@ def estimate_token_count_from_bytes(payload: bytes) -> int:
     if not payload:
         return 0
     text = payload.decode("utf-8", errors="ignore")
-    if text.strip():
+    if text and not text.isspace():
         return estimate_token_count(text)
     return max(1, len(payload) // 4)
 
@@ -61,7 +61,7 @@ def _persist_document(
     destination = (root / "originals" / safe_rel_path).resolve()
     LocalStorage().write_bytes(destination, payload)
 
-    size_bytes = destination.stat().st_size
+    size_bytes = len(payload)
     document = Document.objects.create(
         handbook_id=handbook_id,
         name=Path(safe_rel_path).name,
@@ -72,17 +72,19 @@ def _persist_document(
     )
 
     contract = extract_variable_contract(destination, payload)
-    variables: list[DocumentVariable] = []
-    for name, config in sorted(contract.items(), key=lambda item: item[0]):
-        variable = DocumentVariable.objects.create(
-            document=document,
-            variable_name=name,
-            required=bool(config.get("required", False)),
-            source=str(config.get("source", DocumentVariable.Source.USER_INPUT)),
-            type=str(config.get("type", "string")),
-            metadata=config.get("metadata") or {},
-        )
-        variables.append(variable)
+    variables = DocumentVariable.objects.bulk_create(
+        [
+            DocumentVariable(
+                document=document,
+                variable_name=name,
+                required=bool(config.get("required", False)),
+                source=str(config.get("source", DocumentVariable.Source.USER_INPUT)),
+                type=str(config.get("type", "string")),
+                metadata=config.get("metadata") or {},
+            )
+            for name, config in sorted(contract.items(), key=lambda item: item[0])
+        ]
+    )
 
     DocumentVersion.objects.create(
         document=document,
@@ -104,9 +106,9 @@ def upload_document(
     relative_path: str | None = None,
 ) -> UploadResult:
     ext = _validate_extension(uploaded.name)
-    uploaded_bytes = uploaded.read()
 
     if ext != ".zip":
+        uploaded_bytes = uploaded.read()
         safe_rel_path = sanitize_relative_path(relative_path or "", uploaded.name)
         try:
             document, variables = _persist_document(
@@ -131,7 +133,8 @@ def upload_document(
         )
 
     try:
-        zip_result = inspect_zip_payload(uploaded.name, uploaded_bytes)
+        # ZipFile seeks within the upload itself; only the entries we keep are read.
+        zip_result = inspect_zip_payload(uploaded.name, uploaded)
     except BadZipFile:
         raise UploadValidationError("Invalid ZIP archive")
     documents: list[Document] = []
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import atexit
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+import os
+import threading
+
+from django.conf import settings
+
+# Deliberately free of model imports: forkserver children unpickle tasks by module path,
+# and this module has to be importable before django.setup() runs in the child.
+
+_pool: ProcessPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
+
+def _setup_worker(settings_module: str) -> None:
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", settings_module)
+    import django
+
+    django.setup()
+
+
+def worker_pool_size() -> int:
+    return max(1, int(getattr(settings, "HANDBOOK_WORKER_PROCESSES", 4)))
+
+
+def should_use_worker_pool(task_count: int) -> bool:
+    if worker_pool_size() < 2:
+        return False
+    return task_count >= max(2, int(getattr(settings, "HANDBOOK_PARALLEL_MIN_FILES", 16)))
+
+
+def get_worker_pool() -> ProcessPoolExecutor:
+    """Return the process-wide pool, starting it on first use.
+
+    Workers come from a forkserver rather than fork(): they never inherit the server's
+    threads, locks or open database connections, and they live for the whole process.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                max_workers=worker_pool_size(),
+                mp_context=multiprocessing.get_context("forkserver"),
+                initializer=_setup_worker,
+                initargs=(os.environ.get("DJANGO_SETTINGS_MODULE", "config.settings"),),
+            )
+        return _pool
+
+
+def reset_worker_pool() -> None:
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+atexit.register(reset_worker_pool)
@@ -4,6 +4,7 @@ from dataclasses import dataclass
 from io import BytesIO
 import mimetypes
 from pathlib import Path, PurePosixPath
+from typing import BinaryIO
 from zipfile import BadZipFile, ZipFile
 
 from .common import SUPPORTED_IMAGE_EXTS, SUPPORTED_TEMPLATE_EXTS, sanitize_relative_path
@@ -72,13 +73,13 @@ def _detect_asset_type(filename: str) -> str | None:
     return None
 
 
-def inspect_zip_payload(filename: str, payload: bytes) -> ZipIngestionResult:
+def inspect_zip_payload(filename: str, payload: bytes | BinaryIO) -> ZipIngestionResult:
     templates: dict[str, ZipTemplateEntry] = {}
     assets: dict[str, ZipAssetEntry] = {}
     warnings: list[dict[str, str]] = []
 
     try:
-        archive = ZipFile(BytesIO(payload), "r")
+        archive = ZipFile(BytesIO(payload) if isinstance(payload, bytes) else payload, "r")
     except BadZipFile as exc:
         raise BadZipFile(f"Invalid zip file: {filename}") from exc
 
@@ -117,7 +118,6 @@ def inspect_zip_payload(filename: str, payload: bytes) -> ZipIngestionResult:
                 )
                 continue
 
-            entry_payload = archive.read(info)
             ext = Path(safe_name).suffix.lower()
             mime_type = _guess_mime_type(safe_name)
 
@@ -135,7 +135,7 @@ def inspect_zip_payload(filename: str, payload: bytes) -> ZipIngestionResult:
                 templates[rel_path] = ZipTemplateEntry(
                     relative_path=rel_path,
                     filename=Path(rel_path).name,
-                    payload=entry_payload,
+                    payload=archive.read(info),
                     mime_type=mime_type,
                 )
                 continue
@@ -154,7 +154,7 @@ def inspect_zip_payload(filename: str, payload: bytes) -> ZipIngestionResult:
                 assets[asset_type] = ZipAssetEntry(
                     asset_type=asset_type,
                     filename=Path(safe_name).name,
-                    payload=entry_payload,
+                    payload=archive.read(info),
                     mime_type=mime_type,
                 )
                 continue
@@ -0,0 +1,46 @@
+import hashlib
+import os
+from pathlib import Path
+import tempfile
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from documents.services import asset_resolver
+from documents.services.asset_resolver import AssetIntegrityError, AssetRef, StorageAssetResolver
+
+
+class LoadBufferTests(SimpleTestCase):
+    def setUp(self):
+        self.enterContext(mock.patch.object(asset_resolver, "_verified_digests", asset_resolver.OrderedDict()))
+        self.path = Path(self.enterContext(tempfile.TemporaryDirectory())) / "logo.png"
+        self.payload = b"\x89PNG logo bytes"
+        self.path.write_bytes(self.payload)
+        self.asset = AssetRef(
+            id="asset-1",
+            handbook_id="hb-1",
+            key="assets.logo",
+            filename="logo.png",
+            mime_type="image/png",
+            size_bytes=len(self.payload),
+            sha256=hashlib.sha256(self.payload).hexdigest(),
+            storage_path=str(self.path),
+        )
+        self.resolver = StorageAssetResolver()
+
+    def test_unchanged_file_is_not_hashed_again(self):
+        self.assertEqual(self.resolver.load_buffer(self.asset), self.payload)
+
+        with mock.patch.object(asset_resolver.hashlib, "sha256") as sha256:
+            self.assertEqual(self.resolver.load_buffer(self.asset), self.payload)
+        sha256.assert_not_called()
+
+    def test_rewritten_file_is_hashed_and_rejected(self):
+        self.assertEqual(self.resolver.load_buffer(self.asset), self.payload)
+
+        stat = self.path.stat()
+        self.path.write_bytes(b"\x89PNG evil bytes")
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        with self.assertRaises(AssetIntegrityError):
+            self.resolver.load_buffer(self.asset)
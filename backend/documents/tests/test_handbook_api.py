@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 import base64
+from concurrent.futures.process import BrokenProcessPool
 from io import BytesIO
 from pathlib import Path
 import tempfile
+from unittest import mock
 from zipfile import ZIP_DEFLATED, ZipFile
 
 from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import IntegrityError
 from django.test import TestCase, override_settings
 from django.utils import timezone
 from rest_framework.test import APIClient
@@ -21,7 +24,10 @@ from documents.models import (
     PlaceholderValue,
     WorkspaceAsset,
 )
+from documents.services import handbook_service
 from documents.services.handbook_service import autofill_placeholders_from_client
+from documents.services.storage import LocalFilesystemStorage
+from documents.services.worker_pool import reset_worker_pool
 
 
 class HandbookApiTests(TestCase):
@@ -97,6 +103,36 @@ class HandbookApiTests(TestCase):
             format="multipart",
         )
 
+    def _upload_placeholder_docx(self, handbook_id: str, keys_by_path: dict[str, str]) -> dict[str, str]:
+        archive = BytesIO()
+        with ZipFile(archive, "w", compression=ZIP_DEFLATED) as bundle:
+            for relative_path, key in keys_by_path.items():
+                doc = WordDocument()
+                doc.add_paragraph(f"{{{{{key}}}}}")
+                stream = BytesIO()
+                doc.save(stream)
+                bundle.writestr(relative_path, stream.getvalue())
+        upload_res = self._upload_zip_bytes(handbook_id, archive.getvalue())
+        self.assertEqual(upload_res.status_code, 201)
+        return {item["path_in_handbook"]: item["id"] for item in upload_res.json()["files"]}
+
+    def _save_placeholder_value(self, handbook_id: str, file_id: str, key: str, value: str) -> None:
+        save_res = self.client.post(
+            f"/api/v1/handbooks/{handbook_id}/placeholders/save",
+            {"file_id": file_id, "values": [{"key": key, "value_text": value}], "source": "MANUAL"},
+            format="json",
+        )
+        self.assertEqual(save_res.status_code, 200)
+
+    def _export_document_xml(self, handbook_id: str) -> dict[str, str]:
+        export_res = self.client.post(f"/api/v1/handbooks/{handbook_id}/export", {}, format="json")
+        self.assertEqual(export_res.status_code, 200)
+        with ZipFile(BytesIO(b"".join(export_res.streaming_content)), "r") as export_archive:
+            return {
+                name: ZipFile(BytesIO(export_archive.read(name))).read("word/document.xml").decode("utf-8")
+                for name in export_archive.namelist()
+            }
+
     @override_settings(DOCUMENTS_DATA_ROOT=Path("/tmp"))
     def test_upload_zip_skips_junk_and_unsafe_paths(self):
         handbook_id = self._create_handbook()
@@ -690,3 +726,199 @@ class HandbookApiTests(TestCase):
         self.assertEqual(completion["required_total"], 0)
         self.assertEqual(completion["required_resolved"], 0)
         self.assertEqual(completion["files"], [])
+
+    @override_settings(DOCUMENTS_DATA_ROOT=Path("/tmp"))
+    def test_export_reuses_rendered_files_whose_inputs_are_unchanged(self):
+        handbook_id = self._create_handbook()
+        archive = BytesIO()
+        with ZipFile(archive, "w", compression=ZIP_DEFLATED) as bundle:
+            for relative_path, key in [("docs/a.docx", "custom.one"), ("docs/b.docx", "custom.two")]:
+                doc = WordDocument()
+                doc.add_paragraph(f"{{{{{key}}}}}")
+                stream = BytesIO()
+                doc.save(stream)
+                bundle.writestr(relative_path, stream.getvalue())
+
+        upload_res = self._upload_zip_bytes(handbook_id, archive.getvalue())
+        self.assertEqual(upload_res.status_code, 201)
+        file_ids = {item["path_in_handbook"]: item["id"] for item in upload_res.json()["files"]}
+
+        def save_value(path: str, key: str, value: str) -> None:
+            save_res = self.client.post(
+                f"/api/v1/handbooks/{handbook_id}/placeholders/save",
+                {"file_id": file_ids[path], "values": [{"key": key, "value_text": value}], "source": "MANUAL"},
+                format="json",
+            )
+            self.assertEqual(save_res.status_code, 200)
+
+        def export_documents() -> dict[str, str]:
+            export_res = self.client.post(f"/api/v1/handbooks/{handbook_id}/export", {}, format="json")
+            self.assertEqual(export_res.status_code, 200)
+            with ZipFile(BytesIO(b"".join(export_res.streaming_content)), "r") as export_archive:
+                return {
+                    path: ZipFile(BytesIO(export_archive.read(path))).read("word/document.xml").decode("utf-8")
+                    for path in file_ids
+                }
+
+        save_value("docs/a.docx", "custom.one", "Alpha")
+        save_value("docs/b.docx", "custom.two", "Beta")
+        first = export_documents()
+        self.assertIn("Alpha", first["docs/a.docx"])
+        self.assertIn("Beta", first["docs/b.docx"])
+
+        cache_dir = Path(Handbook.objects.get(id=handbook_id).root_storage_path) / "render-cache"
+        cached_before = {entry.name for entry in cache_dir.iterdir()}
+        self.assertEqual(len(cached_before), 2)
+
+        save_value("docs/b.docx", "custom.two", "Gamma")
+        second = export_documents()
+        self.assertIn("Alpha", second["docs/a.docx"])
+        self.assertIn("Gamma", second["docs/b.docx"])
+
+        cached_after = {entry.name for entry in cache_dir.iterdir()}
+        self.assertEqual(len(cached_after), 2)
+        self.assertEqual(len(cached_before & cached_after), 1)
+
+    def test_export_renders_duplicate_files_once_without_shifting_later_files(self):
+        handbook_id = self._create_handbook()
+
+        def docx_bytes(key: str) -> bytes:
+            doc = WordDocument()
+            doc.add_paragraph(f"{{{{{key}}}}}")
+            stream = BytesIO()
+            doc.save(stream)
+            return stream.getvalue()
+
+        duplicate = docx_bytes("custom.one")
+        archive = BytesIO()
+        with ZipFile(archive, "w", compression=ZIP_DEFLATED) as bundle:
+            bundle.writestr("a/one.docx", duplicate)
+            bundle.writestr("b/one.docx", duplicate)
+            bundle.writestr("c/two.docx", docx_bytes("custom.two"))
+
+        upload_res = self._upload_zip_bytes(handbook_id, archive.getvalue())
+        self.assertEqual(upload_res.status_code, 201)
+        file_ids = {item["path_in_handbook"]: item["id"] for item in upload_res.json()["files"]}
+
+        for path, key, value in [("a/one.docx", "custom.one", "ALPHA"), ("c/two.docx", "custom.two", "BETA")]:
+            save_res = self.client.post(
+                f"/api/v1/handbooks/{handbook_id}/placeholders/save",
+                {"file_id": file_ids[path], "values": [{"key": key, "value_text": value}], "source": "MANUAL"},
+                format="json",
+            )
+            self.assertEqual(save_res.status_code, 200)
+
+        export_res = self.client.post(f"/api/v1/handbooks/{handbook_id}/export", {}, format="json")
+        self.assertEqual(export_res.status_code, 200)
+        with ZipFile(BytesIO(b"".join(export_res.streaming_content)), "r") as export_archive:
+            documents = {
+                path: ZipFile(BytesIO(export_archive.read(path))).read("word/document.xml").decode("utf-8")
+                for path in file_ids
+            }
+
+        self.assertIn("ALPHA", documents["a/one.docx"])
+        self.assertIn("ALPHA", documents["b/one.docx"])
+        self.assertIn("BETA", documents["c/two.docx"])
+        self.assertNotIn("ALPHA", documents["c/two.docx"])
+
+    def test_export_rerenders_only_files_whose_values_changed(self):
+        handbook_id = self._create_handbook()
+        file_ids = self._upload_placeholder_docx(handbook_id, {"a.docx": "custom.one", "b.docx": "custom.two"})
+        self._save_placeholder_value(handbook_id, file_ids["a.docx"], "custom.one", "Alpha")
+        self._save_placeholder_value(handbook_id, file_ids["b.docx"], "custom.two", "Beta")
+        self._export_document_xml(handbook_id)
+
+        self._save_placeholder_value(handbook_id, file_ids["b.docx"], "custom.two", "Gamma")
+        with mock.patch.object(
+            handbook_service, "_render_export_payload", wraps=handbook_service._render_export_payload
+        ) as render_payload:
+            documents = self._export_document_xml(handbook_id)
+
+        self.assertEqual([call.args[1].name for call in render_payload.call_args_list], ["b.docx"])
+        self.assertIn("Alpha", documents["a.docx"])
+        self.assertIn("Gamma", documents["b.docx"])
+
+    def test_export_prunes_cache_entries_no_longer_in_use(self):
+        handbook_id = self._create_handbook()
+        file_ids = self._upload_placeholder_docx(handbook_id, {"a.docx": "custom.one"})
+        self._save_placeholder_value(handbook_id, file_ids["a.docx"], "custom.one", "Alpha")
+        self._export_document_xml(handbook_id)
+
+        cache_dir = Path(Handbook.objects.get(id=handbook_id).root_storage_path) / "render-cache"
+        (first_entry,) = cache_dir.iterdir()
+        (cache_dir / "orphan.docx").write_bytes(b"stale")
+
+        self._save_placeholder_value(handbook_id, file_ids["a.docx"], "custom.one", "Beta")
+        self._export_document_xml(handbook_id)
+
+        (second_entry,) = cache_dir.iterdir()
+        self.assertNotEqual(second_entry.name, first_entry.name)
+        self.assertIn(b"Beta", ZipFile(second_entry).read("word/document.xml"))
+
+    def test_export_rerenders_when_a_cache_entry_disappears_before_copy(self):
+        handbook_id = self._create_handbook()
+        file_ids = self._upload_placeholder_docx(handbook_id, {"a.docx": "custom.one"})
+        self._save_placeholder_value(handbook_id, file_ids["a.docx"], "custom.one", "Alpha")
+        self._export_document_xml(handbook_id)
+
+        copy = LocalFilesystemStorage.copy
+
+        def copy_after_prune(storage, source, destination):
+            if Path(source).parent.name == "render-cache":
+                Path(source).unlink()
+            return copy(storage, source, destination)
+
+        with mock.patch.object(LocalFilesystemStorage, "copy", copy_after_prune):
+            documents = self._export_document_xml(handbook_id)
+
+        self.assertIn("Alpha", documents["a.docx"])
+        cache_dir = Path(Handbook.objects.get(id=handbook_id).root_storage_path) / "render-cache"
+        self.assertEqual(len(list(cache_dir.iterdir())), 1)
+
+    @override_settings(HANDBOOK_PARALLEL_MIN_FILES=2, HANDBOOK_WORKER_PROCESSES=2)
+    def test_export_in_worker_pool_keeps_archive_order_and_contents(self):
+        self.addCleanup(reset_worker_pool)
+        handbook_id = self._create_handbook()
+        keys_by_path = {f"docs/{index}.docx": f"custom.k{index}" for index in range(5)}
+        file_ids = self._upload_placeholder_docx(handbook_id, keys_by_path)
+        for path, key in keys_by_path.items():
+            self._save_placeholder_value(handbook_id, file_ids[path], key, f"Wert-{path}")
+
+        documents = self._export_document_xml(handbook_id)
+
+        self.assertEqual(list(documents), sorted(keys_by_path))
+        for path, xml in documents.items():
+            self.assertIn(f"Wert-{path}", xml)
+            self.assertEqual(xml.count("Wert-"), 1)
+
+    @override_settings(HANDBOOK_PARALLEL_MIN_FILES=2, HANDBOOK_WORKER_PROCESSES=2)
+    def test_export_resets_worker_pool_when_it_breaks(self):
+        handbook_id = self._create_handbook()
+        keys_by_path = {"a.docx": "custom.one", "b.docx": "custom.two"}
+        file_ids = self._upload_placeholder_docx(handbook_id, keys_by_path)
+        for path, key in keys_by_path.items():
+            self._save_placeholder_value(handbook_id, file_ids[path], key, "Wert")
+
+        broken_pool = mock.Mock()
+        broken_pool.map.side_effect = BrokenProcessPool("worker died")
+        with (
+            mock.patch.object(handbook_service, "get_worker_pool", return_value=broken_pool),
+            mock.patch.object(handbook_service, "reset_worker_pool") as reset_pool,
+            self.assertRaises(BrokenProcessPool),
+        ):
+            handbook_service.export_handbook(handbook=Handbook.objects.get(id=handbook_id))
+
+        reset_pool.assert_called_once_with()
+        exports_dir = Path(Handbook.objects.get(id=handbook_id).root_storage_path) / "exports"
+        self.assertEqual(list(exports_dir.glob("*.zip")), [])
+
+    def test_create_handbook_leaves_no_directory_when_insert_fails(self):
+        data_root = Path(self.temp_dir.name)
+        with (
+            override_settings(DOCUMENTS_DATA_ROOT=data_root),
+            mock.patch.object(Handbook.objects, "create", side_effect=IntegrityError("insert failed")),
+            self.assertRaises(IntegrityError),
+        ):
+            handbook_service.create_handbook(customer_id=str(self.customer.id), handbook_type="ISO9001")
+
+        self.assertFalse((data_root / "handbooks").exists())
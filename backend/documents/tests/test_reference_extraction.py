@@ -0,0 +1,204 @@
+from datetime import date, datetime, time, timedelta
+import hashlib
+from io import BytesIO
+from pathlib import Path
+import stat
+import tempfile
+from unittest import mock, skipUnless
+
+from django.conf import settings
+from django.core.files.uploadedfile import TemporaryUploadedFile
+from django.test import SimpleTestCase, TestCase, override_settings
+from docx import Document as WordDocument
+from openpyxl import Workbook
+
+from clients.models import Client
+from documents.models import DocumentTextExtractionCache
+from documents.services import reference_extraction
+from documents.services.reference_extraction import (
+    EXTRACTOR_VERSION,
+    extract_reference_document,
+    extractor_version,
+)
+from documents.services.handbook_service import create_handbook
+from documents.services.reference_service import _get_or_extract_cached, upload_reference_document
+
+
+def _minimal_pdf(pages: list[str]) -> bytes:
+    objects: list[bytes | None] = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        None,
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    kids: list[int] = []
+    for text in pages:
+        stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET".encode("latin-1")
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % len(objects)
+        )
+        kids.append(len(objects))
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (
+        b" ".join(b"%d 0 R" % kid for kid in kids),
+        len(kids),
+    )
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets: list[int] = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(out)
+
+
+class PdfReferenceExtractionTests(SimpleTestCase):
+    pages = ["Qualitaetshandbuch Kapitel eins", "Verantwortung der Leitung"]
+
+    def test_pypdf_reads_page_texts(self):
+        payload = _minimal_pdf(self.pages)
+        self.assertEqual(reference_extraction._pypdf_page_texts(payload), self.pages)
+
+    @skipUnless(reference_extraction.pymupdf is not None, "PyMuPDF is not installed")
+    def test_pymupdf_and_pypdf_read_the_same_page_texts(self):
+        payload = _minimal_pdf(self.pages)
+        self.assertEqual(
+            reference_extraction._pymupdf_page_texts(payload),
+            reference_extraction._pypdf_page_texts(payload),
+        )
+
+    def test_falls_back_to_pypdf_when_pymupdf_rejects_the_file(self):
+        payload = _minimal_pdf(self.pages)
+        with (
+            mock.patch.object(reference_extraction, "pymupdf", object()),
+            mock.patch.object(reference_extraction, "_pymupdf_page_texts", side_effect=RuntimeError("broken")),
+        ):
+            document = extract_reference_document(payload=payload, file_type="PDF")
+        self.assertEqual([section.locator["page"] for section in document.sections], [1, 2])
+        self.assertIn("Verantwortung der Leitung", document.sections[1].content)
+
+
+def _workbook_bytes() -> bytes:
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.title = "Kennzahlen"
+    sheet.append(["Prozess", 1, 2.5, True, None, "Audit"])
+    sheet.append([date(2024, 3, 1), datetime(2024, 3, 1, 13, 45, 10), time(8, 30), timedelta(hours=30)])
+    sheet.append([1e20, -0.0, 3.0, 12345678901234, "  "])
+    workbook.create_sheet("Leer")
+    stream = BytesIO()
+    workbook.save(stream)
+    return stream.getvalue()
+
+
+class XlsxReferenceExtractionTests(SimpleTestCase):
+    @skipUnless(reference_extraction.CalamineWorkbook is not None, "python-calamine is not installed")
+    def test_calamine_and_openpyxl_produce_identical_sections(self):
+        payload = _workbook_bytes()
+        with_calamine = extract_reference_document(payload=payload, file_type="XLSX")
+        with mock.patch.object(reference_extraction, "CalamineWorkbook", None):
+            with_openpyxl = extract_reference_document(payload=payload, file_type="XLSX")
+        self.assertEqual(
+            [(section.title, section.content) for section in with_calamine.sections],
+            [(section.title, section.content) for section in with_openpyxl.sections],
+        )
+        self.assertIn("2024-03-01 00:00:00", with_openpyxl.sections[0].content)
+
+
+def _merged_table_docx() -> bytes:
+    document = WordDocument()
+    document.add_paragraph("Einleitung")
+    table = document.add_table(rows=3, cols=3)
+    table.cell(0, 0).merge(table.cell(0, 1)).text = "Prozess"
+    table.cell(0, 2).text = "Verantwortlich"
+    table.cell(1, 0).text = "Audit"
+    table.cell(1, 1).text = "jaehrlich"
+    table.cell(1, 2).merge(table.cell(2, 2)).text = "QMB"
+    table.cell(2, 0).text = "Review"
+    table.cell(2, 1).text = "quartalsweise"
+    stream = BytesIO()
+    document.save(stream)
+    return stream.getvalue()
+
+
+def _minimal_docx(text: str) -> bytes:
+    document = WordDocument()
+    document.add_paragraph(text)
+    stream = BytesIO()
+    document.save(stream)
+    return stream.getvalue()
+
+
+class DocxReferenceExtractionTests(SimpleTestCase):
+    def test_merged_table_cells_appear_once(self):
+        document = extract_reference_document(payload=_merged_table_docx(), file_type="DOCX")
+        table_section = next(section for section in document.sections if section.locator.get("table") == 1)
+        self.assertEqual(
+            table_section.content.splitlines(),
+            ["Prozess | Verantwortlich", "Audit | jaehrlich | QMB", "Review | quartalsweise"],
+        )
+
+
+class TextExtractionCacheTests(TestCase):
+    def test_entries_from_another_extractor_version_are_not_reused(self):
+        source_path = Path(self.enterContext(tempfile.TemporaryDirectory())) / "merged.docx"
+        source_path.write_bytes(_merged_table_docx())
+        stale = extract_reference_document(payload=_minimal_docx("Veraltet"), file_type="DOCX")
+        DocumentTextExtractionCache.objects.create(
+            checksum="a" * 64,
+            file_type="DOCX",
+            extractor_version=str(EXTRACTOR_VERSION - 1),
+            normalized_data=reference_extraction.serialize_normalized_document(stale),
+        )
+
+        normalized = _get_or_extract_cached(checksum="a" * 64, file_type="DOCX", source_path=source_path)
+
+        self.assertIn("Prozess | Verantwortlich", "\n".join(section.content for section in normalized.sections))
+        self.assertTrue(
+            DocumentTextExtractionCache.objects.filter(
+                checksum="a" * 64,
+                file_type="DOCX",
+                extractor_version=extractor_version("DOCX"),
+            ).exists()
+        )
+
+
+class ReferenceUploadTests(TestCase):
+    def test_disk_backed_upload_is_stored_with_checksum_and_upload_mode(self):
+        data_root = Path(self.enterContext(tempfile.TemporaryDirectory()))
+        self.enterContext(override_settings(DOCUMENTS_DATA_ROOT=data_root))
+        customer = Client.objects.create(
+            name="Beispiel GmbH",
+            address="Musterstrasse 1",
+            zip_city="12345 Berlin",
+            ceo="Max Mustermann",
+            qm_manager="Erika Beispiel",
+            employee_count=22,
+            products="Produkt A",
+            services="Service B",
+            industry="Maschinenbau",
+        )
+        handbook = create_handbook(customer_id=str(customer.id), handbook_type="ISO9001")
+
+        payload = _minimal_docx("Qualitaetspolitik")
+        uploaded = TemporaryUploadedFile(
+            "politik.docx",
+            "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+            len(payload),
+            None,
+        )
+        self.addCleanup(uploaded.close)
+        uploaded.write(payload)
+        uploaded.flush()
+
+        reference_document = upload_reference_document(handbook=handbook, uploaded=uploaded)
+
+        stored = Path(reference_document.storage_path)
+        self.assertEqual(stored.read_bytes(), payload)
+        self.assertEqual(reference_document.checksum, hashlib.sha256(payload).hexdigest())
+        self.assertEqual(reference_document.size_bytes, len(payload))
+        self.assertEqual(stat.S_IMODE(stored.stat().st_mode), settings.FILE_UPLOAD_PERMISSIONS or 0o644)
@@ -5,6 +5,7 @@ from pathlib import Path
 from zipfile import BadZipFile
 
 from django.conf import settings
+from django.db import transaction
 from django.http import FileResponse, Http404
 from django.utils import timezone
 from rest_framework import status
@@ -290,18 +291,20 @@ def download_document_view(request, document_id: str):
         return Response({"error": "Version not found"}, status=status.HTTP_404_NOT_FOUND)
 
     path = Path(version.file_path)
-    if not path.exists():
+    try:
+        handle = path.open("rb")
+    except FileNotFoundError:
         raise Http404("Version binary not found")
 
-    payload = path.read_bytes()
+    payload = handle.read()
+    handle.seek(0)
     log_token_metrics(
         path=path,
         estimated_token_count=estimate_token_count_from_bytes(payload),
     )
 
-    response = FileResponse(path.open("rb"), content_type=version.mime_type)
+    response = FileResponse(handle, content_type=version.mime_type)
     response["Content-Disposition"] = f'attachment; filename="{path.name}"'
-    response["Content-Length"] = str(path.stat().st_size)
     return response
 
 
@@ -374,16 +377,7 @@ def handbook_assets_view(request, handbook_id: str):
         asset_type=asset_type,
         asset_id=str(asset.id),
     )
-    sync_asset_placeholder_value(
-        handbook=handbook,
-        asset_type=asset_type,
-    )
-    _sync_client_asset_from_workspace(
-        handbook=handbook,
-        asset_type=asset_type,
-        asset=asset,
-    )
-    refresh_handbook_completion(handbook=handbook)
+    _sync_asset_state(handbook=handbook, asset_type=asset_type, asset=asset)
 
     return Response({"asset": WorkspaceAssetSerializer(asset).data}, status=status.HTTP_201_CREATED)
 
@@ -407,16 +401,7 @@ def handbook_signature_asset_view(request, handbook_id: str):
             asset_type="signature",
             asset_id=str(asset.id),
         )
-        sync_asset_placeholder_value(
-            handbook=handbook,
-            asset_type="signature",
-        )
-        _sync_client_asset_from_workspace(
-            handbook=handbook,
-            asset_type="signature",
-            asset=None,
-        )
-        refresh_handbook_completion(handbook=handbook)
+        _sync_asset_state(handbook=handbook, asset_type="signature", asset=None)
         return Response({"status": "deleted", "asset_type": "signature"}, status=status.HTTP_200_OK)
 
     uploaded = request.FILES.get("file")
@@ -444,16 +429,7 @@ def handbook_signature_asset_view(request, handbook_id: str):
     except AssetValidationError as exc:
         return Response({"error": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
 
-    sync_asset_placeholder_value(
-        handbook=handbook,
-        asset_type="signature",
-    )
-    _sync_client_asset_from_workspace(
-        handbook=handbook,
-        asset_type="signature",
-        asset=asset,
-    )
-    refresh_handbook_completion(handbook=handbook)
+    _sync_asset_state(handbook=handbook, asset_type="signature", asset=asset)
     return Response({"asset": WorkspaceAssetSerializer(asset).data}, status=status.HTTP_201_CREATED)
 
 
@@ -475,16 +451,7 @@ def handbook_asset_detail_view(request, handbook_id: str, asset_type: str):
         asset_type=asset_type,
         asset_id=str(asset.id),
     )
-    sync_asset_placeholder_value(
-        handbook=handbook,
-        asset_type=asset_type,
-    )
-    _sync_client_asset_from_workspace(
-        handbook=handbook,
-        asset_type=asset_type,
-        asset=None,
-    )
-    refresh_handbook_completion(handbook=handbook)
+    _sync_asset_state(handbook=handbook, asset_type=asset_type, asset=None)
     return Response({"status": "deleted", "asset_type": asset_type}, status=status.HTTP_200_OK)
 
 
@@ -498,7 +465,9 @@ def handbook_asset_download_view(request, handbook_id: str, asset_type: str):
         return Response({"error": "Asset not found"}, status=status.HTTP_404_NOT_FOUND)
 
     path = Path(asset.file_path)
-    if not path.exists():
+    try:
+        handle = path.open("rb")
+    except FileNotFoundError:
         return Response({"error": "Asset binary not found"}, status=status.HTTP_404_NOT_FOUND)
 
     _dev_log(
@@ -508,9 +477,8 @@ def handbook_asset_download_view(request, handbook_id: str, asset_type: str):
         asset_id=str(asset.id),
     )
 
-    response = FileResponse(path.open("rb"), content_type=asset.mime_type or "application/octet-stream")
+    response = FileResponse(handle, content_type=asset.mime_type or "application/octet-stream")
     response["Content-Disposition"] = f'attachment; filename="{path.name}"'
-    response["Content-Length"] = str(path.stat().st_size)
     response["Cache-Control"] = "no-store, no-cache, must-revalidate, max-age=0"
     response["Pragma"] = "no-cache"
     response["Expires"] = "0"
@@ -524,6 +492,13 @@ def _get_handbook_or_404(handbook_id: str) -> Handbook | None:
     return handbook
 
 
+@transaction.atomic
+def _sync_asset_state(*, handbook: Handbook, asset_type: str, asset) -> None:
+    sync_asset_placeholder_value(handbook=handbook, asset_type=asset_type)
+    _sync_client_asset_from_workspace(handbook=handbook, asset_type=asset_type, asset=asset)
+    refresh_handbook_completion(handbook=handbook)
+
+
 def _sync_client_asset_from_workspace(
     *,
     handbook: Handbook,
@@ -1042,7 +1017,6 @@ def handbook_version_download_view(request, handbook_id: str, version_number: in
 
     response = FileResponse(export_path.open("rb"), content_type="application/zip")
     response["Content-Disposition"] = f'attachment; filename="{export_path.name}"'
-    response["Content-Length"] = str(export_path.stat().st_size)
     return response
 
 
@@ -1068,7 +1042,6 @@ def handbook_export_view(request, handbook_id: str):
 
     response = FileResponse(zip_path.open("rb"), content_type="application/zip")
     response["Content-Disposition"] = f'attachment; filename=\"{zip_path.name}\"'
-    response["Content-Length"] = str(zip_path.stat().st_size)
     response["X-Snapshot-Version"] = str(snapshot.version_number)
     return response
 
@@ -8,6 +8,12 @@ from .collector import collect_variables, collect_variables_with_locations
 from .ooxml_normalizer import normalize_ooxml_xml
 from .renderer import render
 
+# Byte markers for "{{ }}" tokens and the legacy [LOGO] / __ASSET_LOGO__ aliases.
+TOKEN_MARKERS = (b"{{", b"[", b"__")
+
+# Fast DEFLATE level for rewritten packages; XML compresses nearly as well as at the default.
+OOXML_COMPRESSLEVEL = 1
+
 OOXML_PART_PREFIXES = {
     "docx": ("word/",),
     "pptx": ("ppt/",),
@@ -70,6 +76,43 @@ def extract_placeholder_locations_from_ooxml_bytes(
     return locations
 
 
+def _render_part(
+    archive: ZipFile,
+    name: str,
+    ext: str,
+    values: dict[str, object],
+    required_variables: set[str] | None,
+) -> tuple[bytes | None, list[dict[str, object]], list[dict[str, object]]]:
+    data = archive.read(name)
+    if not any(marker in data for marker in TOKEN_MARKERS):
+        return None, [], []
+    xml = data.decode("utf-8", errors="ignore")
+    xml = normalize_ooxml_xml(xml, ext)
+    ast = parse_template_cached(xml)
+    result = render(
+        ast,
+        values,
+        required_variables=required_variables,
+        fail_fast_on_required=False,
+        preserve_unresolved=True,
+    )
+    unresolved = [{"xml_path": name, **item} for item in result.unresolved]
+    errors = [
+        {
+            "xml_path": name,
+            "error_code": err.code,
+            "message": err.message,
+            "start": err.start,
+            "end": err.end,
+            "variable": err.variable,
+            "path": err.path,
+        }
+        for err in result.errors
+    ]
+    output_data = result.output.encode("utf-8")
+    return (output_data if output_data != data else None), unresolved, errors
+
+
 def apply_placeholders_to_ooxml_bytes(
     source_bytes: bytes,
     ext: str,
@@ -83,41 +126,32 @@ def apply_placeholders_to_ooxml_bytes(
 
     unresolved: list[dict[str, object]] = []
     errors: list[dict[str, object]] = []
+    rendered: dict[str, bytes] = {}
 
-    output = BytesIO()
     with ZipFile(BytesIO(source_bytes), "r") as archive_in:
+        targets = [info.filename for info in archive_in.infolist() if _is_target_xml(ext, info.filename)]
+        for name in targets:
+            output_data, part_unresolved, part_errors = _render_part(
+                archive_in,
+                name,
+                ext=ext,
+                values=values,
+                required_variables=required_variables,
+            )
+            unresolved.extend(part_unresolved)
+            errors.extend(part_errors)
+            if output_data is not None:
+                rendered[name] = output_data
+
+        if not rendered:
+            return source_bytes, unresolved, errors
+
+        output = BytesIO()
         with ZipFile(output, "w", compression=ZIP_DEFLATED) as archive_out:
             for info in archive_in.infolist():
-                data = archive_in.read(info.filename)
-                if _is_target_xml(ext, info.filename):
-                    xml = data.decode("utf-8", errors="ignore")
-                    xml = normalize_ooxml_xml(xml, ext)
-                    ast = parse_template_cached(xml)
-                    result = render(
-                        ast,
-                        values,
-                        required_variables=required_variables,
-                        fail_fast_on_required=False,
-                        preserve_unresolved=True,
-                    )
-                    unresolved.extend(
-                        [{"xml_path": info.filename, **item} for item in result.unresolved]
-                    )
-                    errors.extend(
-                        [
-                            {
-                                "xml_path": info.filename,
-                                "error_code": err.code,
-                                "message": err.message,
-                                "start": err.start,
-                                "end": err.end,
-                                "variable": err.variable,
-                                "path": err.path,
-                            }
-                            for err in result.errors
-                        ]
-                    )
-                    data = result.output.encode("utf-8")
-                archive_out.writestr(info, data)
+                data = rendered.get(info.filename)
+                if data is None:
+                    data = archive_in.read(info.filename)
+                archive_out.writestr(info, data, compresslevel=OOXML_COMPRESSLEVEL)
 
     return output.getvalue(), unresolved, errors
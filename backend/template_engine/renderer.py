@@ -57,17 +57,23 @@ def render(
     output_parts: list[str] = []
     unresolved: list[dict[str, object]] = []
     errors: list[TemplateEngineError] = []
+    # Variables repeat across nodes; canonicalize and resolve each raw name once per render.
+    resolved_by_raw: dict[str, tuple[str, str | None]] = {}
 
     for node in ast.nodes:
         if node.kind == "text":
             output_parts.append(node.text)
             continue
 
-        variable = canonicalize_name(node.variable, aliases)
-        found, value = _resolve(data, variable)
-        serialized = _serialize(value).strip() if found else ""
+        cached = resolved_by_raw.get(node.variable)
+        if cached is None:
+            variable = canonicalize_name(node.variable, aliases)
+            found, value = _resolve(data, variable)
+            rendered = _serialize(value) if found else ""
+            cached = resolved_by_raw[node.variable] = (variable, rendered if rendered.strip() else None)
+        variable, rendered = cached
 
-        if not found or serialized == "":
+        if rendered is None:
             unresolved.append(
                 {
                     "variable": variable,
@@ -99,7 +105,7 @@ def render(
                 output_parts.append("")
             continue
 
-        output_parts.append(_serialize(value))
+        output_parts.append(rendered)
 
     return RenderResult(
         output="".join(output_parts),
@@ -58,6 +58,9 @@ def tokenize(template: str) -> list[Token]:
     tokens: list[Token] = []
     i = 0
     length = len(template)
+    if "{{" not in template:
+        _append_text(tokens, template, 0, length)
+        return tokens
 
     while i < length:
         if template.startswith("\\{{", i):